@@ -0,0 +1,76 @@
+from collections import deque
+
+from alphabet import get_sequence, get_sequences
+
+
+# goto   = Trie transitions, one dict per state
+# fail   = Failure link, the longest proper suffix of the state that is also a state
+# output = Pattern ids that end at the state, including those reached by failure links
+
+
+def get_automaton(patterns):
+    goto = [{}]
+    fail = [0]
+    output = [[]]
+
+    for k, pattern in enumerate(patterns):
+        s = 0
+        for x in pattern:
+            t = goto[s].get(x)
+            if t is None:
+                t = len(goto)
+                goto.append({})
+                fail.append(0)
+                output.append([])
+                goto[s][x] = t
+            s = t
+        output[s].append(k)
+
+    # The states of depth 1 fail to the root, so they end the empty pattern too
+    for t in goto[0].values():
+        output[t].extend(output[0])
+
+    queue = deque(goto[0].values())
+    while queue:
+        s = queue.popleft()
+        for x, t in goto[s].items():
+            queue.append(t)
+
+            f = fail[s]
+            while f and x not in goto[f]:
+                f = fail[f]
+            fail[t] = goto[f].get(x, 0)
+
+            output[t].extend(output[fail[t]])
+
+    return goto, fail, output
+
+
+def test_get_automaton():
+    goto, fail, output = get_automaton(["he", "she", "his", "hers"])
+    assert len(goto) == 10
+    assert fail[goto[goto[goto[0]["s"]]["h"]]["e"]] == goto[goto[0]["h"]]["e"]
+    assert output[goto[goto[goto[0]["s"]]["h"]]["e"]] == [1, 0]
+
+
+def get_matches(patterns, text):
+    text = get_sequence(text)
+    patterns = [get_sequences(pattern, text)[0] for pattern in patterns]
+    lengths = [len(pattern) for pattern in patterns]
+
+    goto, fail, output = get_automaton(patterns)
+
+    # The empty pattern is in the output of every state, so it is reported after
+    # every symbol, and at offset 0 before the first
+    matches = [(k, 0) for k in output[0]]
+
+    s = 0
+    for j, x in enumerate(text):
+        while s and x not in goto[s]:
+            s = fail[s]
+        s = goto[s].get(x, 0)
+
+        for k in output[s]:
+            matches.append((k, j - lengths[k] + 1))
+
+    return matches
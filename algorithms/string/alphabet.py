@@ -0,0 +1,98 @@
+from itertools import repeat
+
+BYTE_SIZE = 256
+
+# The id of every symbol that does not occur in the pattern
+OTHER = 0
+
+
+# Remaps the symbols of a pattern to dense ids, so tables are O(σ) for the
+# σ distinct symbols of the pattern and work for any code point
+class Alphabet:
+    def __init__(self, pattern):
+        self.ids = {}
+        for x in pattern:
+            if x not in self.ids:
+                self.ids[x] = len(self.ids) + 1
+
+        self.size = len(self.ids) + 1
+
+    def get_id(self, x):
+        return self.ids.get(x, OTHER)
+
+    def get_ids(self, s):
+        return map(self.ids.get, s, repeat(OTHER))
+
+
+# The bytes of a bytes-like object are already dense ids
+class ByteAlphabet:
+    size = BYTE_SIZE
+
+    def get_id(self, x):
+        return x
+
+    def get_ids(self, s):
+        return s
+
+
+def get_alphabet(pattern):
+    if isinstance(pattern, str):
+        return Alphabet(pattern)
+
+    return ByteAlphabet()
+
+
+def test_get_alphabet():
+    alphabet = get_alphabet("αβα€")
+    assert alphabet.size == 4
+    assert alphabet.get_id("α") == 1
+    assert alphabet.get_id("€") == 3
+    assert alphabet.get_id("a") == OTHER
+    assert list(alphabet.get_ids("€aβ")) == [3, OTHER, 2]
+
+    alphabet = get_alphabet(b"ab")
+    assert alphabet.size == BYTE_SIZE
+    assert alphabet.get_id(255) == 255
+
+
+# Get a sequence of symbols, a bytes-like object (bytes, bytearray, memoryview,
+# mmap) is viewed as unsigned bytes without copying
+def get_sequence(s):
+    if isinstance(s, str):
+        return s
+
+    return memoryview(s).cast("B")
+
+
+# Get an iterator over the code points of a str or the bytes of a bytes-like object
+def get_codes(s):
+    if isinstance(s, str):
+        return map(ord, s)
+
+    return iter(s)
+
+
+def get_sequences(pattern, text):
+    pattern = get_sequence(pattern)
+    text = get_sequence(text)
+
+    if isinstance(pattern, str) != isinstance(text, str):
+        raise TypeError("cannot match a str against a bytes-like object")
+
+    return pattern, text
+
+
+def test_get_sequences():
+    pattern, text = get_sequences(b"ab", bytearray(b"\xffab"))
+    assert pattern[0] == 97
+    assert text[0] == 255
+
+    assert list(get_codes("aé")) == [97, 233]
+    assert list(get_codes(get_sequence(b"a\xff"))) == [97, 255]
+
+    try:
+        get_sequences("ab", b"ab")
+        assert False
+    except TypeError:
+        pass
+
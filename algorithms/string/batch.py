@@ -0,0 +1,63 @@
+import numpy as np
+
+from alphabet import get_alphabet, get_sequences
+from shift_or import get_transitions
+
+# The states of a record are held in one unsigned 64 bit integer
+WORD_SIZE = 64
+
+
+# Pack records into one buffer, record i is buffer[offsets[i]:offsets[i + 1]]
+def pack(records):
+    buffer = b"".join(records)
+
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(record) for record in records], out=offsets[1:])
+
+    return np.frombuffer(buffer, dtype=np.uint8), offsets
+
+
+# Find the occurrences of a bytes-like pattern in every record of a packed buffer,
+# running shift-or one text position at a time across all the records at once.
+# Returns the record indices and offsets of the matches as arrays, sorted by both.
+# Time: O(m + N) vectorized operations over the N bytes of the buffer, in O(max record length) steps
+def get_batch_matches(pattern, buffer, offsets):
+    pattern, buffer = get_sequences(pattern, buffer)
+
+    m = len(pattern)
+    if not 0 < m <= WORD_SIZE:
+        raise ValueError(f"pattern length must be between 1 and {WORD_SIZE}")
+
+    buffer = np.frombuffer(buffer, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    no_states = np.uint64((1 << m) - 1)
+    transitions = np.array(get_transitions(pattern, get_alphabet(pattern)), dtype=np.uint64)
+
+    # With the records sorted by decreasing length, those longer than j are a prefix
+    lengths = np.diff(offsets)
+    order = np.argsort(-lengths, kind="stable")
+    starts = offsets[:-1][order]
+    lengths = lengths[order]
+
+    states = np.full(len(order), no_states, dtype=np.uint64)
+
+    records = []
+    matches = []
+    for j in range(int(lengths.max(initial=0))):
+        active = np.searchsorted(-lengths, -j, side="left")
+
+        y = buffer[starts[:active] + j]
+        states[:active] = ((states[:active] << 1) & no_states) | transitions[y]
+
+        if j >= m - 1:
+            hits = np.flatnonzero(states[:active] >> (m - 1) == 0)
+            records.append(order[hits])
+            matches.append(np.full(len(hits), j - m + 1, dtype=np.int64))
+
+    records = np.concatenate(records) if records else np.zeros(0, dtype=np.int64)
+    matches = np.concatenate(matches) if matches else np.zeros(0, dtype=np.int64)
+
+    indices = np.lexsort((matches, records))
+
+    return records[indices], matches[indices]
@@ -0,0 +1,203 @@
+# Benchmark the string matching algorithms on synthetic corpora
+#
+# python benchmark.py --output results.json
+# python benchmark.py --corpora dna --algorithms shift_or horspool --lengths 4 8
+# python benchmark.py --crossovers
+#
+# Every record holds the preprocessing time, the search time and throughput with
+# the preprocessed tables, and the peak memory of a full get_matches call.
+
+from argparse import ArgumentParser
+from json import dump
+from platform import platform, python_version
+from random import Random
+from sys import stdout
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from compiled import ALGORITHMS
+
+SEED = 0
+
+TEXT_LENGTH = 100_000
+
+PATTERN_LENGTHS = [2, 4, 8, 16, 32, 64]
+
+REPEAT = 3
+
+# The crossover grid used for the thresholds in find.py
+ALPHABET_SIZES = [2, 4, 8, 16, 32, 64]
+CROSSOVER_PATTERN_LENGTHS = [2, 4, 8, 16, 32, 64, 128]
+
+WORDS = (
+    "the of and to in is that it was for on are as with his they at be this from have or by one had not but what all "
+    "were when we there can an your which their said if do will each about how up out them then she many some so "
+    "these would other into has more her two like him see time could no make than first been its who now people my "
+    "made over did down only way find use may water long little very after words called just where most know"
+).split()
+
+
+def get_random_text(random, n, alphabet_size=26):
+    symbols = [chr(97 + i) for i in range(alphabet_size)]
+    return "".join(random.choices(symbols, k=n))
+
+
+def get_dna_text(random, n):
+    return "".join(random.choices("ACGT", k=n))
+
+
+# Words drawn with Zipf's law frequencies, separated by spaces
+def get_english_text(random, n):
+    weights = [1 / (rank + 1) for rank in range(len(WORDS))]
+
+    words = []
+    length = 0
+    while length < n:
+        word = random.choices(WORDS, weights)[0]
+        words.append(word)
+        length += len(word) + 1
+
+    return " ".join(words)[:n]
+
+
+# a^(n - 1) b, the worst case for naive matching of a^(m - 1) b
+def get_adversarial_text(random, n):
+    return "a" * (n - 1) + "b"
+
+
+CORPORA = {
+    "random": get_random_text,
+    "dna": get_dna_text,
+    "english": get_english_text,
+    "adversarial": get_adversarial_text,
+}
+
+
+def get_pattern(random, corpus, text, m):
+    if corpus == "adversarial":
+        return "a" * (m - 1) + "b"
+
+    i = random.randrange(len(text) - m + 1)
+    return text[i : i + m]
+
+
+def get_seconds(function, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start_time = perf_counter()
+        function()
+        seconds.append(perf_counter() - start_time)
+
+    return min(seconds)
+
+
+def get_peak_memory(function):
+    start()
+    try:
+        function()
+        _, peak = get_traced_memory()
+    finally:
+        stop()
+
+    return peak
+
+
+def get_record(corpus, algorithm, pattern, text, repeat):
+    module = ALGORITHMS[algorithm]
+
+    tables = module.preprocess(pattern)
+    matches = module.get_matches(pattern, text, tables)
+
+    preprocess_seconds = get_seconds(lambda: module.preprocess(pattern), repeat)
+    search_seconds = get_seconds(lambda: module.get_matches(pattern, text, tables), repeat)
+    peak_memory = get_peak_memory(lambda: module.get_matches(pattern, text))
+
+    return {
+        "corpus": corpus,
+        "algorithm": algorithm,
+        "pattern_length": len(pattern),
+        "text_length": len(text),
+        "matches": len(matches),
+        "preprocess_seconds": preprocess_seconds,
+        "search_seconds": search_seconds,
+        "throughput_mb_s": len(text) / search_seconds / 1e6,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run(corpora=CORPORA, algorithms=ALGORITHMS, lengths=PATTERN_LENGTHS, n=TEXT_LENGTH, repeat=REPEAT, seed=SEED):
+    random = Random(seed)
+
+    records = []
+    for corpus in corpora:
+        text = CORPORA[corpus](random, n)
+        for m in lengths:
+            pattern = get_pattern(random, corpus, text, m)
+            for algorithm in algorithms:
+                records.append(get_record(corpus, algorithm, pattern, text, repeat))
+
+    return {
+        "python": python_version(),
+        "platform": platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "records": records,
+    }
+
+
+def test_run():
+    results = run(lengths=[1, 3], n=100, repeat=1)
+    assert len(results["records"]) == len(CORPORA) * 2 * len(ALGORITHMS)
+
+    for record in results["records"]:
+        assert record["matches"] >= 1
+        assert record["peak_memory_bytes"] > 0
+
+
+def get_crossovers(algorithms=ALGORITHMS, alphabet_sizes=ALPHABET_SIZES, lengths=CROSSOVER_PATTERN_LENGTHS):
+    random = Random(SEED)
+
+    crossovers = []
+    for alphabet_size in alphabet_sizes:
+        text = get_random_text(random, TEXT_LENGTH, alphabet_size)
+        for m in lengths:
+            pattern = get_pattern(random, "random", text, m)
+            seconds = {}
+            for algorithm in algorithms:
+                module = ALGORITHMS[algorithm]
+                tables = module.preprocess(pattern)
+                seconds[algorithm] = get_seconds(lambda: module.get_matches(pattern, text, tables), REPEAT)
+            crossovers.append((alphabet_size, m, seconds))
+
+    return crossovers
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark the string matching algorithms")
+    parser.add_argument("--corpora", nargs="+", choices=list(CORPORA), default=list(CORPORA))
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--lengths", nargs="+", type=int, default=PATTERN_LENGTHS)
+    parser.add_argument("--size", type=int, default=TEXT_LENGTH)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", help="write the JSON results to this path instead of stdout")
+    parser.add_argument("--crossovers", action="store_true", help="rank the algorithms by alphabet size")
+    args = parser.parse_args()
+
+    if args.crossovers:
+        for alphabet_size, m, seconds in get_crossovers(args.algorithms):
+            ranking = sorted(seconds, key=seconds.get)
+            print(f"σ={alphabet_size:<3} m={m:<4}", " ".join(f"{a}={seconds[a] * 1000:.1f}ms" for a in ranking[:4]))
+        return
+
+    results = run(args.corpora, args.algorithms, args.lengths, args.size, args.repeat, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            dump(results, file, indent=2)
+    else:
+        dump(results, stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
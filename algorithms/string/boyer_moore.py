@@ -1,63 +1,40 @@
-def extended_bad_character(text):
-    m = len(text)
-
-    r = [[] for _ in range(128)]
-
-    for j in reversed(range(m)):
-        x = text[j]
-        r[ord(x)].append(j)
-
-    return r
+from alphabet import get_alphabet, get_sequence, get_sequences
+from matches import get_match_functions
 
 
-def z_algorithm(text):
+def extended_bad_character(text, alphabet):
     m = len(text)
 
-    z = [0 for _ in range(m)]
+    r = [[] for _ in range(alphabet.size)]
 
-    l = 0
-    r = 0
-    for i in range(1, m):
-        if i > r:
-            j = i
-            while j < m and text[j - i] == text[j]:
-                j += 1
-            z[i] = j - i
+    ids = list(alphabet.get_ids(text))
+    for j in reversed(range(m)):
+        x = ids[j]
+        r[x].append(j)
 
-            if z[i] > 0:
-                l = i
-                r = i + z[i]
+    return r
 
-        else:
-            if z[i - l] < r - i:
-                z[i] = z[i - l]
 
-            else:
-                j = r
-                while j < m and text[j - i] == text[j]:
-                    j += 1
-                z[i] = j - i
+def preprocess(pattern):
+    pattern = get_sequence(pattern)
+    alphabet = get_alphabet(pattern)
 
-                l = i
-                r = i + z[i]
+    return alphabet, extended_bad_character(pattern, alphabet)
 
-    return z
 
+# Find occurrences of the pattern with the extended bad character rule only,
+# see boyer_moore_2 for the good suffix and matched prefix rules
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
 
-def boyer_moore(pattern, text):
-    p = []
+    alphabet, r = preprocess(pattern) if tables is None else tables
+    get_id = alphabet.get_id
 
     m = len(pattern)
     n = len(text)
 
-    r = extended_bad_character(pattern)
-
-    reversed_pattern = pattern[::-1]
-    z = z_algorithm(reversed_pattern)[::-1]
-    print(z)
-
     i = 0
-    while i < n - m:
+    while i <= n - m:
         j = m - 1
         while j >= 0:
             x = text[i + j]
@@ -69,20 +46,21 @@ def boyer_moore(pattern, text):
             j -= 1
 
         if j == -1:
-            p.append(i)
-            i += m - 1
+            yield i
+            i += 1
         else:
-            o = 1
-            for s in r[ord(x)]:
+            o = j + 1
+            for s in r[get_id(x)]:
                 if s < j:
                     o = j - s
                     break
             i += o
 
-    return p
+
+get_matches, find_first, count = get_match_functions(iter_matches)
 
 
 if __name__ == "__main__":
-    print(boyer_moore("aba", "bbabaxababay"))
-    print(boyer_moore("geek", "geeks for geeks"))
-    print(boyer_moore("acababacaba", "acxcbbacabacabaa"))
+    print(get_matches("aba", "bbabaxababay"))
+    print(get_matches("geek", "geeks for geeks"))
+    print(get_matches("acababacaba", "acxcbbacabacabaa"))
@@ -4,7 +4,8 @@
 # https://www.youtube.com/watch?v=lkL6RkQvpMM
 
 
-# N  = Alphabet length
+# A  = Alphabet of the pattern
+# N  = Alphabet size, the distinct symbols of the pattern plus one for any other
 #
 # P  = Pattern
 # m  = Pattern length
@@ -16,8 +17,6 @@
 # j  = Text index
 # y  = Text character
 #
-# R  = Bad character table
-# Rk = Extended bad character table
 # Rl = Efficient extended bad character table
 #
 # Zs = Z suffix table
@@ -27,58 +26,23 @@
 # M  = Matches
 
 
-N = 128
-
-
-# Get the bad character table
-# Time: O(m), Space: O(N)
-def get_R(P):
-    m = len(P)
-
-    R = [-1 for _ in range(N)]
-
-    i = 0
-    while i < m:
-        x = P[i]
-        R[ord(x)] = i
-
-        i += 1
-
-    return R
-
-
-# Get the extended bad character table
-# Time: O(m^2), Space: O(N*m)
-def get_Rk(P):
-    m = len(P)
-
-    Rk = [[-1 for _ in range(N)] for _ in range(m)]
-
-    k = 0
-    while k < m:
-        i = 0
-        while i < k:
-            x = P[i]
-            Rk[k][ord(x)] = i
-
-            i += 1
-
-        k += 1
-
-    return Rk
+from alphabet import get_alphabet, get_sequence, get_sequences
+from matches import get_match_functions
 
 
 # Get the efficient extended bad character table
 # Time: O(m), Space: O(N)
-def get_Rl(P):
+def get_Rl(P, A):
     m = len(P)
+    N = A.size
 
     Rl = [[] for _ in range(N)]
+    ids = list(A.get_ids(P))
 
     i = m - 1
     while i >= 0:
-        x = P[i]
-        Rl[ord(x)].append(i)
+        x = ids[i]
+        Rl[x].append(i)
 
         i -= 1
 
@@ -127,76 +91,114 @@ def get_Zs(P):
     return get_Z(P[::-1])[::-1]
 
 
-# Get the good suffix table
+# Get the good suffix table, the end of the rightmost copy of the suffix P[s:]
+# that is not preceded by P[s - 1], or -1 if there is none
 # Time: O(m), Space: O(m)
-def get_Gs(P):
+def get_Gs(P, Zs):
     m = len(P)
 
-    Zs = get_Zs(P)
-    print("Zs", Zs)
+    Gs = [-1 for _ in range(m + 1)]
 
-    Gs = [0 for _ in range(m)]
+    e = 0
+    while e < m - 1:
+        s = m - Zs[e]
+        Gs[s] = e
 
-    p = 0
-    while p < m:
-        i = m - Zs[p] - 1
-        Gs[i] = p
-        p += 1
+        e += 1
 
     return Gs
 
 
-# Get the matched prefix table
+# Get the matched prefix table, the length of the longest suffix of P[s:] that
+# is also a prefix of P
 # Time: O(m), Space: O(m)
-def get_Mp(P):
+def get_Mp(P, Zs):
     m = len(P)
 
-    Mp = [0 for _ in range(m)]
+    Mp = [0 for _ in range(m + 1)]
+
+    s = m - 1
+    while s > 0:
+        k = m - s
+        Mp[s] = k if Zs[k - 1] == k else Mp[s + 1]
+
+        s -= 1
 
     return Mp
 
 
-# Find occurrences of P in T
-# Time: O(m + n), Space: O(m + n)
-def boyer_moore(P, T):
-    print("P", P)
-    print("T", T)
+def preprocess(P):
+    P = get_sequence(P)
+    A = get_alphabet(P)
+
+    Zs = get_Zs(P)
+
+    return A, get_Rl(P, A), get_Gs(P, Zs), get_Mp(P, Zs)
+
 
-    M = []
+# Find occurrences of P in T with the extended bad character, strong good suffix
+# and matched prefix rules. Galil's rule skips the prefix of P known to match
+# after a shift by the period of P.
+# Time: O(m + n), Space: O(m)
+def iter_matches(P, T, tables=None):
+    P, T = get_sequences(P, T)
 
     m = len(P)
     n = len(T)
 
-    Rk = get_Rk(P)
+    A, Rl, Gs, Mp = preprocess(P) if tables is None else tables
+    get_id = A.get_id
 
-    Gs = get_Gs(P)
-    print("Gs", Gs)
+    # The shift after a match, the period of P
+    p = m - Mp[1] if m > 1 else 1
 
-    Mp = get_Mp(P)
-    print("Mp", Mp)
+    # P[:k] is known to match T[j:j + k]
+    k = 0
 
     j = 0
-    while j < n - m:
+    while j <= n - m:
         i = m - 1
-        while i >= 0:
-            x = P[i]
-            y = T[j + i]
+        while i >= k and P[i] == T[j + i]:
+            i -= 1
 
-            if x != y:
-                break
+        if i < k:
+            yield j
 
-            i -= 1
+            j += p
+            k = m - p
 
-        if i == -1:
-            M.append(j)
-            j += m - 1
         else:
-            j += i - Rk[i][ord(y)]
+            y = T[j + i]
+
+            bad_character = i + 1
+            for l in Rl[get_id(y)]:
+                if l < i:
+                    bad_character = i - l
+                    break
+
+            good_suffix = 1
+            if i < m - 1:
+                s = i + 1
+                good_suffix = m - 1 - Gs[s] if Gs[s] >= 0 else m - Mp[s]
+
+            j += max(bad_character, good_suffix)
+            k = 0
+
+
+get_matches, find_first, count = get_match_functions(iter_matches)
+
+
+def test_get_Gs():
+    P = "abaabaab"
+    assert get_Gs(P, get_Zs(P)) == [-1, -1, -1, 4, -1, -1, 1, -1, 6]
+
 
-    return M
+def test_get_Mp():
+    P = "abaabaab"
+    assert get_Mp(P, get_Zs(P)) == [0, 5, 5, 5, 2, 2, 2, 0, 0]
 
 
 if __name__ == "__main__":
-    print(boyer_moore("aba", "bbabaxababay"))
-    print(boyer_moore("geek", "geeks for geeks"))
-    print(boyer_moore("acababacaba", "acxcbbacabacabaa"))
+    print(get_matches("aba", "bbabaxababay"))
+    print(get_matches("geek", "geeks for geeks"))
+    print(get_matches("acababacaba", "acxcbbacabacabaa"))
@@ -0,0 +1,109 @@
+from functools import lru_cache
+
+from alphabet import get_sequence, get_sequences
+import boyer_moore
+import boyer_moore_2
+import horspool
+import knuth_morris_pratt
+import knuth_morris_pratt_modified
+import rabin_karp
+import shift_or
+import sunday
+import two_way
+import z
+
+ALGORITHMS = {
+    "boyer_moore": boyer_moore,
+    "boyer_moore_2": boyer_moore_2,
+    "horspool": horspool,
+    "knuth_morris_pratt": knuth_morris_pratt,
+    "knuth_morris_pratt_modified": knuth_morris_pratt_modified,
+    "rabin_karp": rabin_karp,
+    "shift_or": shift_or,
+    "sunday": sunday,
+    "two_way": two_way,
+    "z": z,
+}
+
+DEFAULT_ALGORITHM = "knuth_morris_pratt"
+
+CACHE_SIZE = 512
+
+
+# A pattern with the tables of its algorithm, similar to re.Pattern
+class CompiledPattern:
+    def __init__(self, pattern, algorithm=DEFAULT_ALGORITHM):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm {algorithm!r}")
+
+        self.pattern = get_sequence(pattern)
+        self.algorithm = algorithm
+        self.module = ALGORITHMS[algorithm]
+
+        # The empty pattern matches at every offset of the text like str.find, the
+        # algorithms are not defined for it
+        self.empty = len(self.pattern) == 0
+        self.tables = None if self.empty else self.module.preprocess(self.pattern)
+
+    # Get the offsets 0, ..., n of the empty pattern in the text
+    def get_empty_matches(self, text):
+        _, text = get_sequences(self.pattern, text)
+        return range(len(text) + 1)
+
+    def get_matches(self, text):
+        if self.empty:
+            return list(self.get_empty_matches(text))
+
+        return self.module.get_matches(self.pattern, text, self.tables)
+
+    def iter_matches(self, text):
+        if self.empty:
+            return iter(self.get_empty_matches(text))
+
+        return self.module.iter_matches(self.pattern, text, self.tables)
+
+    def find_first(self, text):
+        if self.empty:
+            return self.get_empty_matches(text)[0]
+
+        return self.module.find_first(self.pattern, text, self.tables)
+
+    def count(self, text):
+        if self.empty:
+            return len(self.get_empty_matches(text))
+
+        return self.module.count(self.pattern, text, self.tables)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_compiled_pattern(pattern, algorithm):
+    return CompiledPattern(pattern, algorithm)
+
+
+# Compile a pattern, the most recently used patterns are cached by (pattern, algorithm)
+def compile(pattern, algorithm=DEFAULT_ALGORITHM):
+    if not isinstance(pattern, (str, bytes)):
+        pattern = bytes(pattern)
+
+    return get_compiled_pattern(pattern, algorithm)
+
+
+def purge():
+    get_compiled_pattern.cache_clear()
+
+
+def test_compile():
+    purge()
+
+    pattern = compile("aba", "shift_or")
+    assert pattern.get_matches("bbabaxababay") == [2, 6, 8]
+    assert pattern is compile("aba", "shift_or")
+    assert pattern is not compile("aba", "z")
+    assert compile(bytearray(b"aba")) is compile(b"aba")
+    assert get_compiled_pattern.cache_info().misses == 3
+
+    try:
+        compile("aba", "unknown")
+        assert False
+    except ValueError:
+        pass
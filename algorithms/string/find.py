@@ -0,0 +1,39 @@
+from compiled import compile
+
+# Crossovers measured by benchmark.py --crossovers, in Python the preprocessing and the
+# interpreter overhead per text symbol matter more than the number of comparisons
+SHORT_TEXT = 32
+SHORT_PATTERN = 3
+SMALL_ALPHABET = 2
+SHIFT_OR_PATTERN = 16
+LONG_PATTERN = 32
+
+
+# Choose an algorithm from the pattern length, the pattern alphabet size and the text length n
+def get_algorithm(pattern, n):
+    m = len(pattern)
+
+    if n < SHORT_TEXT or m < SHORT_PATTERN:
+        return "knuth_morris_pratt"
+
+    if len(set(pattern)) <= SMALL_ALPHABET:
+        if m < SHIFT_OR_PATTERN:
+            return "shift_or"
+
+        if m >= LONG_PATTERN:
+            return "boyer_moore_2"
+
+    return "horspool"
+
+
+def test_get_algorithm():
+    assert get_algorithm("ab", 200) == "knuth_morris_pratt"
+    assert get_algorithm("abab", 8) == "knuth_morris_pratt"
+    assert get_algorithm("abab", 200) == "shift_or"
+    assert get_algorithm("ab" * 16, 200) == "boyer_moore_2"
+    assert get_algorithm("abc", 200) == "horspool"
+
+
+# The empty pattern is left to CompiledPattern, which matches it at every offset
+def find_all(pattern, text):
+    return compile(pattern, get_algorithm(pattern, len(text))).get_matches(text)
@@ -0,0 +1,58 @@
+from alphabet import get_alphabet, get_sequence, get_sequences
+from matches import get_match_functions
+
+
+# Get the shift table, the distance from the last occurrence of each symbol in
+# pattern[:m - 1] to the end of the pattern
+# Time: O(m + σ), Space: O(σ)
+def get_shifts(pattern, alphabet):
+    m = len(pattern)
+
+    shifts = [m for _ in range(alphabet.size)]
+
+    ids = list(alphabet.get_ids(pattern))
+    for i in range(m - 1):
+        shifts[ids[i]] = m - 1 - i
+
+    return shifts
+
+
+def test_get_shifts():
+    alphabet = get_alphabet("abcab")
+    shifts = get_shifts("abcab", alphabet)
+    assert shifts[alphabet.get_id("a")] == 1
+    assert shifts[alphabet.get_id("b")] == 3
+    assert shifts[alphabet.get_id("c")] == 2
+    assert shifts[alphabet.get_id("x")] == 5
+
+
+def preprocess(pattern):
+    pattern = get_sequence(pattern)
+    alphabet = get_alphabet(pattern)
+
+    return alphabet, get_shifts(pattern, alphabet)
+
+
+# Find occurrences of the pattern, shifting by the text symbol under the last
+# symbol of the pattern
+# Time: O(mn), Space: O(σ)
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
+    alphabet, shifts = preprocess(pattern) if tables is None else tables
+    get_id = alphabet.get_id
+
+    m = len(pattern)
+    n = len(text)
+
+    j = 0
+    while j <= n - m:
+        y = text[j + m - 1]
+
+        if y == pattern[m - 1] and text[j : j + m] == pattern:
+            yield j
+
+        j += shifts[get_id(y)]
+
+
+get_matches, find_first, count = get_match_functions(iter_matches)
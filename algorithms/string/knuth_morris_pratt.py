@@ -1,3 +1,5 @@
+from alphabet import get_sequence, get_sequences
+from matches import get_match_functions
 from z import get_z_values
 
 
@@ -27,13 +29,17 @@ def test_get_sp_values():
     assert get_sp_values("abacababa ") == [0, 0, 1, 0, 0, 0, 3, 0, 3, 0]
 
 
-def get_matches(pattern, text):
+def preprocess(pattern):
+    return get_sp_values(get_sequence(pattern))
+
+
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
     m = len(pattern)
     n = len(text)
 
-    sp = get_sp_values(pattern)
-
-    matches = []
+    sp = preprocess(pattern) if tables is None else tables
 
     i = 0
     j = 0
@@ -43,7 +49,7 @@ def get_matches(pattern, text):
             j += 1
 
             if i == m:
-                matches.append(j - i)
+                yield j - i
                 i = sp[i - 1]
 
         else:
@@ -52,4 +58,51 @@ def get_matches(pattern, text):
             else:
                 i = sp[i - 1]
 
-    return matches
+
+get_matches, find_first, count = get_match_functions(iter_matches)
+
+
+class StreamMatcher:
+    def __init__(self, pattern):
+        self.pattern = get_sequence(pattern)
+        self.sp = get_sp_values(self.pattern)
+
+        self.i = 0
+        self.offset = 0
+
+    def feed(self, chunk):
+        pattern, chunk = get_sequences(self.pattern, chunk)
+        sp = self.sp
+
+        m = len(pattern)
+        n = len(chunk)
+
+        matches = []
+
+        i = self.i
+        j = 0
+        while j < n:
+            if pattern[i] == chunk[j]:
+                i += 1
+                j += 1
+
+                if i == m:
+                    matches.append(self.offset + j - i)
+                    i = sp[i - 1]
+
+            else:
+                if i == 0:
+                    j += 1
+                else:
+                    i = sp[i - 1]
+
+        self.i = i
+        self.offset += n
+
+        return matches
+
+
+def get_stream_matches(pattern, chunks):
+    matcher = StreamMatcher(pattern)
+    for chunk in chunks:
+        yield from matcher.feed(chunk)
@@ -1,29 +1,38 @@
+from alphabet import get_alphabet, get_sequence, get_sequences
+from matches import get_match_functions
 from z import get_z_values
 
 
-def get_spxi(s):
-    N = 128
+def get_spxi(s, alphabet):
+    N = alphabet.size
     n = len(s)
 
     spxi = [[0 for _ in range(n)] for _ in range(N)]
 
     z = get_z_values(s)
+    ids = list(alphabet.get_ids(s))
 
     l = n - 1
     while l > 0:
         r = l + z[l] - 1
-        x = s[z[l]]
-        spxi[ord(x)][r] = z[l]
+        x = ids[z[l]]
+        spxi[x][r] = z[l]
         l -= 1
 
     return spxi
 
 
 def test_get_spxi():
-    spxi = get_spxi("abaabac")
-    assert spxi[ord("a")] == [0, 0, 0, 0, 0, 3, 0]
-    assert spxi[ord("b")] == [0, 0, 1, 0, 0, 1, 0]
-    assert spxi[ord("c")] == [0, 0, 0, 0, 0, 0, 0]
+    alphabet = get_alphabet("abaabac")
+    spxi = get_spxi("abaabac", alphabet)
+    assert len(spxi) == 4
+    assert spxi[alphabet.get_id("a")] == [0, 0, 0, 0, 0, 3, 0]
+    assert spxi[alphabet.get_id("b")] == [0, 0, 1, 0, 0, 1, 0]
+    assert spxi[alphabet.get_id("c")] == [0, 0, 0, 0, 0, 0, 0]
+
+    spxi = get_spxi(b"\xff\xfe\xff", get_alphabet(b""))
+    assert len(spxi) == 256
+    assert spxi[0xFE] == [0, 0, 1]
 
 
 def get_spix(s):
@@ -55,11 +64,17 @@ def test_get_spix():
     assert spix[6] == []
 
 
-def get_matches(pattern, text):
+def preprocess(pattern):
+    return get_spix(get_sequence(pattern))
+
+
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
     m = len(pattern)
     n = len(text)
 
-    spix = get_spix(pattern)
+    spix = preprocess(pattern) if tables is None else tables
 
     def get_sp(i, j):
         if j < n:
@@ -72,8 +87,6 @@ def get_matches(pattern, text):
 
         return 0
 
-    matches = []
-
     i = 0
     j = 0
     while j < n:
@@ -82,7 +95,7 @@ def get_matches(pattern, text):
             j += 1
 
             if i == m:
-                matches.append(j - i)
+                yield j - i
 
                 i = get_sp(i, j)
 
@@ -93,4 +106,5 @@ def get_matches(pattern, text):
             else:
                 i = get_sp(i, j)
 
-    return matches
+
+get_matches, find_first, count = get_match_functions(iter_matches)
@@ -0,0 +1,28 @@
+# The result of find_first when the pattern does not occur
+NOT_FOUND = -1
+
+
+# Get the get_matches, find_first and count of a matcher from its
+# iter_matches(pattern, text, tables=None) generator
+def get_match_functions(iter_matches):
+    def get_matches(pattern, text, tables=None):
+        return list(iter_matches(pattern, text, tables))
+
+    def find_first(pattern, text, tables=None):
+        return next(iter_matches(pattern, text, tables), NOT_FOUND)
+
+    def count(pattern, text, tables=None):
+        return sum(1 for _ in iter_matches(pattern, text, tables))
+
+    return get_matches, find_first, count
+
+
+def test_get_match_functions():
+    def iter_matches(pattern, text, tables=None):
+        return (i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i))
+
+    get_matches, find_first, count = get_match_functions(iter_matches)
+    assert get_matches("a", "abca") == [0, 3]
+    assert find_first("c", "abca") == 2
+    assert find_first("d", "abca") == NOT_FOUND
+    assert count("a", "abca") == 2
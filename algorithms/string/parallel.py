@@ -0,0 +1,93 @@
+from concurrent.futures import ProcessPoolExecutor
+from mmap import ACCESS_READ, mmap
+from os import cpu_count
+from os.path import getsize
+
+from alphabet import get_sequence
+from compiled import compile
+from find import get_algorithm
+
+# Chunks per worker, so a slow chunk does not leave the other workers idle
+CHUNKS_PER_WORKER = 4
+
+MIN_CHUNK_SIZE = 1 << 16
+
+
+# Get the chunks of start positions [start, stop), each searched over text[start:stop + m - 1].
+# The chunks overlap by m - 1 symbols, so a match that straddles two chunks is found once, in
+# the chunk that owns its start.
+def get_chunks(n, m, workers, chunk_size=None):
+    starts = n - m + 1
+    if starts <= 0:
+        return []
+
+    if chunk_size is None:
+        chunk_size = max(-(-starts // (workers * CHUNKS_PER_WORKER)), MIN_CHUNK_SIZE)
+
+    return [(start, min(start + chunk_size, starts)) for start in range(0, starts, chunk_size)]
+
+
+def test_get_chunks():
+    assert get_chunks(10, 3, 1, 3) == [(0, 3), (3, 6), (6, 8)]
+    assert get_chunks(10, 3, 2) == [(0, 8)]
+    assert get_chunks(2, 3, 2) == []
+
+
+def search_text(pattern, algorithm, text, start):
+    return [start + i for i in compile(pattern, algorithm).get_matches(text)]
+
+
+def search_file(pattern, algorithm, path, start, stop):
+    m = len(pattern)
+
+    with open(path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as text:
+        view = memoryview(text)
+        try:
+            return search_text(pattern, algorithm, view[start : stop + m - 1], start)
+        finally:
+            view.release()
+
+
+# Search the chunks in order, in this process if there is only one worker or chunk
+def search_chunks(search, arguments, workers):
+    if workers == 1 or len(arguments) <= 1:
+        matches = [search(*argument) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            matches = list(executor.map(search, *zip(*arguments)))
+
+    return [i for chunk_matches in matches for i in chunk_matches]
+
+
+# Find the sorted occurrences of the pattern in a str or bytes-like text with a process pool.
+# Each chunk is copied to its worker, use parallel_find_all_in_file for large files.
+def parallel_find_all(pattern, text, workers=None, algorithm=None, chunk_size=None):
+    pattern = pattern if isinstance(pattern, str) else bytes(pattern)
+    text = get_sequence(text)
+
+    workers = workers or cpu_count() or 1
+    algorithm = algorithm or get_algorithm(pattern, len(text))
+
+    m = len(pattern)
+
+    arguments = []
+    for start, stop in get_chunks(len(text), m, workers, chunk_size):
+        chunk = text[start : stop + m - 1]
+        arguments.append((pattern, algorithm, chunk if isinstance(chunk, str) else bytes(chunk), start))
+
+    return search_chunks(search_text, arguments, workers)
+
+
+# Find the sorted occurrences of a bytes-like pattern in a file with a process pool. Each
+# worker maps the file into memory, so the chunks are neither read nor copied by this process.
+def parallel_find_all_in_file(pattern, path, workers=None, algorithm=None, chunk_size=None):
+    pattern = bytes(pattern)
+
+    workers = workers or cpu_count() or 1
+    algorithm = algorithm or get_algorithm(pattern, getsize(path))
+
+    arguments = []
+    for start, stop in get_chunks(getsize(path), len(pattern), workers, chunk_size):
+        arguments.append((pattern, algorithm, path, start, stop))
+
+    return search_chunks(search_file, arguments, workers)
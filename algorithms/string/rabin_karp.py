@@ -0,0 +1,186 @@
+from collections import deque
+from itertools import islice
+
+from alphabet import get_codes, get_sequence, get_sequences
+from matches import get_match_functions
+
+# Greater than every code point, so the hash of a window is exact before the modulus
+BASE = 0x110000
+
+# A Mersenne prime
+MODULUS = (1 << 61) - 1
+
+
+def get_hash(s, base=BASE, modulus=MODULUS):
+    value = 0
+    for x in get_codes(s):
+        value = (value * base + x) % modulus
+
+    return value
+
+
+# A fingerprint of the last window symbols of a stream, updated in O(1) per symbol
+class RollingHash:
+    def __init__(self, window, base=BASE, modulus=MODULUS):
+        self.window = window
+        self.base = base
+        self.modulus = modulus
+
+        # The weight of the symbol that leaves the window
+        self.power = pow(base, window - 1, modulus)
+
+        self.codes = deque()
+        self.value = 0
+        self.offset = 0
+
+    # Push the symbols of a chunk, returning the (start, fingerprint) of every window that fills
+    def feed(self, chunk):
+        window = self.window
+        base = self.base
+        modulus = self.modulus
+        power = self.power
+        codes = self.codes
+
+        fingerprints = []
+
+        value = self.value
+        for y in get_codes(get_sequence(chunk)):
+            if len(codes) == window:
+                value -= codes.popleft() * power
+
+            codes.append(y)
+            value = (value * base + y) % modulus
+
+            if len(codes) == window:
+                fingerprints.append((self.offset, value))
+                self.offset += 1
+
+        self.value = value
+
+        return fingerprints
+
+
+def iter_fingerprints(chunks, window, base=BASE, modulus=MODULUS):
+    rolling_hash = RollingHash(window, base, modulus)
+    for chunk in chunks:
+        yield from rolling_hash.feed(chunk)
+
+
+def test_iter_fingerprints():
+    fingerprints = list(iter_fingerprints(["abra", "cad", "abra"], 4))
+    assert [start for start, _ in fingerprints] == list(range(8))
+    assert fingerprints[0][1] == fingerprints[7][1] == get_hash("abra")
+    assert fingerprints[1][1] == get_hash("brac")
+
+
+# Get the fingerprint of every window text[j:j + m] in order
+# Time: O(n), Space: O(1)
+def iter_window_hashes(text, m, base=BASE, modulus=MODULUS):
+    if m > len(text):
+        return
+
+    power = pow(base, m - 1, modulus)
+
+    leaving = get_codes(text)
+    entering = get_codes(text)
+
+    value = 0
+    for y in islice(entering, m):
+        value = (value * base + y) % modulus
+
+    yield value
+
+    for x, y in zip(leaving, entering):
+        value = ((value - x * power) * base + y) % modulus
+
+        yield value
+
+
+def test_iter_window_hashes():
+    assert list(iter_window_hashes("abcab", 2)) == [get_hash(s) for s in ["ab", "bc", "ca", "ab"]]
+    assert list(iter_window_hashes(b"abcab", 5, 7, 11)) == [get_hash(b"abcab", 7, 11)]
+    assert list(iter_window_hashes("ab", 3)) == []
+
+
+def preprocess(pattern, base=BASE, modulus=MODULUS):
+    return base, modulus, get_hash(get_sequence(pattern), base, modulus)
+
+
+# Find occurrences of the pattern by comparing the fingerprint of every window of
+# the text to the fingerprint of the pattern, and the symbols when they are equal
+# Time: O(n) expected, Space: O(1)
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
+    base, modulus, target = preprocess(pattern) if tables is None else tables
+
+    m = len(pattern)
+
+    for j, value in enumerate(iter_window_hashes(text, m, base, modulus)):
+        if value == target and text[j : j + m] == pattern:
+            yield j
+
+
+get_matches, find_first, count = get_match_functions(iter_matches)
+
+
+# Find the (pattern_id, offset) occurrences of a set of equal length patterns in a
+# single pass, looking the fingerprint of every window up in a table of the patterns
+def get_set_matches(patterns, text, base=BASE, modulus=MODULUS):
+    text = get_sequence(text)
+    patterns = [get_sequences(pattern, text)[0] for pattern in patterns]
+
+    if not patterns:
+        return []
+
+    m = len(patterns[0])
+    if any(len(pattern) != m for pattern in patterns):
+        raise ValueError("patterns must have equal lengths")
+
+    targets = {}
+    for k, pattern in enumerate(patterns):
+        targets.setdefault(get_hash(pattern, base, modulus), []).append(k)
+
+    matches = []
+    for j, value in enumerate(iter_window_hashes(text, m, base, modulus)):
+        for k in targets.get(value, ()):
+            if text[j : j + m] == patterns[k]:
+                matches.append((k, j))
+
+    return matches
+
+
+# Find the (row, column) occurrences of a rectangular pattern in a rectangular
+# text, both given as lists of rows. Every row of the text is fingerprinted with
+# the width of the pattern, then every column of fingerprints with its height.
+# Time: O(rows * columns) expected
+def get_2d_matches(pattern, text, base=BASE, modulus=MODULUS):
+    height = len(pattern)
+    width = len(pattern[0]) if pattern else 0
+
+    if not 0 < height <= len(text) or not 0 < width <= len(text[0]):
+        return []
+
+    target = 0
+    for row in pattern:
+        target = (target * base + get_hash(row, base, modulus)) % modulus
+
+    rows = [list(iter_window_hashes(row, width, base, modulus)) for row in text]
+    power = pow(base, height - 1, modulus)
+
+    matches = []
+    for j in range(len(rows[0])):
+        value = 0
+        for i, row in enumerate(rows):
+            if i >= height:
+                value -= rows[i - height][j] * power
+            value = (value * base + row[j]) % modulus
+
+            if i >= height - 1:
+                top = i - height + 1
+                if value == target and all(text[top + k][j : j + width] == pattern[k] for k in range(height)):
+                    matches.append((top, j))
+
+    matches.sort()
+
+    return matches
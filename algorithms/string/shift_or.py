@@ -1,18 +1,145 @@
-def get_matches(pattern, text):
+from alphabet import get_alphabet, get_sequence, get_sequences
+from matches import get_match_functions
+
+
+def get_transitions(pattern, alphabet):
     m = len(pattern)
-    n = len(text)
 
     no_states = (1 << m) - 1
 
-    transitions = [no_states for _ in range(128)]
-    for i in range(m):
-        transitions[ord(pattern[i])] &= ~(1 << i)
+    transitions = [no_states for _ in range(alphabet.size)]
+    for i, x in enumerate(alphabet.get_ids(pattern)):
+        transitions[x] &= ~(1 << i)
+
+    return transitions
+
+
+def preprocess(pattern):
+    pattern = get_sequence(pattern)
+
+    alphabet = get_alphabet(pattern)
+    transitions = get_transitions(pattern, alphabet)
+
+    return alphabet, transitions
+
+
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
+    m = len(pattern)
+
+    no_states = (1 << m) - 1
+
+    alphabet, transitions = preprocess(pattern) if tables is None else tables
 
-    matches = []
     states = no_states
-    for j in range(n):
-        states = ((states << 1) & no_states) | transitions[ord(text[j])]
+    for j, y in enumerate(alphabet.get_ids(text)):
+        states = ((states << 1) & no_states) | transitions[y]
         if states >> m - 1 == 0:
+            yield j - m + 1
+
+
+get_matches, find_first, count = get_match_functions(iter_matches)
+
+
+# Find the starts of the substrings of the text within k substitutions of the pattern.
+# states[d] holds the prefixes of the pattern matched with at most d substitutions.
+def get_hamming_matches(pattern, text, k):
+    pattern, text = get_sequences(pattern, text)
+
+    m = len(pattern)
+
+    no_states = (1 << m) - 1
+
+    alphabet = get_alphabet(pattern)
+    transitions = get_transitions(pattern, alphabet)
+
+    matches = []
+    states = [no_states for _ in range(k + 1)]
+    for j, y in enumerate(alphabet.get_ids(text)):
+        transition = transitions[y]
+
+        previous = states[0]
+        current = ((previous << 1) & no_states) | transition
+        states[0] = current
+
+        for d in range(1, k + 1):
+            # Match or substitution
+            current = (((states[d] << 1) | transition) & (previous << 1)) & no_states
+            previous = states[d]
+            states[d] = current
+
+        if current >> m - 1 == 0:
             matches.append(j - m + 1)
 
     return matches
+
+
+# Find the stops of the substrings of the text within k insertions, deletions or
+# substitutions of the pattern (Wu-Manber). The start of such a substring is ambiguous.
+def get_levenshtein_matches(pattern, text, k):
+    pattern, text = get_sequences(pattern, text)
+
+    m = len(pattern)
+
+    no_states = (1 << m) - 1
+
+    alphabet = get_alphabet(pattern)
+    transitions = get_transitions(pattern, alphabet)
+
+    matches = []
+    states = [(no_states << d) & no_states for d in range(k + 1)]
+    for j, y in enumerate(alphabet.get_ids(text)):
+        transition = transitions[y]
+
+        previous = states[0]
+        current = ((previous << 1) & no_states) | transition
+        states[0] = current
+
+        for d in range(1, k + 1):
+            # Match, substitution, insertion or deletion
+            current = ((states[d] << 1) | transition) & (previous << 1) & previous & (current << 1) & no_states
+            previous = states[d]
+            states[d] = current
+
+        if current >> m - 1 == 0:
+            matches.append(j + 1)
+
+    return matches
+
+
+class StreamMatcher:
+    def __init__(self, pattern):
+        self.pattern = get_sequence(pattern)
+        self.m = len(pattern)
+        self.no_states = (1 << self.m) - 1
+        self.alphabet = get_alphabet(self.pattern)
+        self.transitions = get_transitions(self.pattern, self.alphabet)
+
+        self.states = self.no_states
+        self.offset = 0
+
+    def feed(self, chunk):
+        _, chunk = get_sequences(self.pattern, chunk)
+
+        m = self.m
+        no_states = self.no_states
+        transitions = self.transitions
+
+        matches = []
+        states = self.states
+        for j, y in enumerate(self.alphabet.get_ids(chunk), self.offset):
+            states = ((states << 1) & no_states) | transitions[y]
+            if states >> m - 1 == 0:
+                matches.append(j - m + 1)
+
+        self.states = states
+        self.offset += len(chunk)
+
+        return matches
+
+
+def get_stream_matches(pattern, chunks):
+    matcher = StreamMatcher(pattern)
+    for chunk in chunks:
+        yield from matcher.feed(chunk)
@@ -0,0 +1,58 @@
+from alphabet import get_alphabet, get_sequence, get_sequences
+from matches import get_match_functions
+
+
+# Get the shift table, the distance from the last occurrence of each symbol in
+# the pattern to the symbol after the end of the pattern
+# Time: O(m + σ), Space: O(σ)
+def get_shifts(pattern, alphabet):
+    m = len(pattern)
+
+    shifts = [m + 1 for _ in range(alphabet.size)]
+
+    for i, x in enumerate(alphabet.get_ids(pattern)):
+        shifts[x] = m - i
+
+    return shifts
+
+
+def test_get_shifts():
+    alphabet = get_alphabet("abcab")
+    shifts = get_shifts("abcab", alphabet)
+    assert shifts[alphabet.get_id("a")] == 2
+    assert shifts[alphabet.get_id("b")] == 1
+    assert shifts[alphabet.get_id("c")] == 3
+    assert shifts[alphabet.get_id("x")] == 6
+
+
+def preprocess(pattern):
+    pattern = get_sequence(pattern)
+    alphabet = get_alphabet(pattern)
+
+    return alphabet, get_shifts(pattern, alphabet)
+
+
+# Find occurrences of the pattern (quick search), shifting by the text symbol
+# just after the window
+# Time: O(mn), Space: O(σ)
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
+    alphabet, shifts = preprocess(pattern) if tables is None else tables
+    get_id = alphabet.get_id
+
+    m = len(pattern)
+    n = len(text)
+
+    j = 0
+    while j < n - m:
+        if text[j : j + m] == pattern:
+            yield j
+
+        j += shifts[get_id(text[j + m])]
+
+    if j == n - m and text[j:] == pattern:
+        yield j
+
+
+get_matches, find_first, count = get_match_functions(iter_matches)
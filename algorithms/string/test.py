@@ -1,9 +1,28 @@
 from itertools import chain, product, tee
+from mmap import mmap
+from pytest import importorskip
+from random import Random
+from tempfile import NamedTemporaryFile, TemporaryFile
 
+from aho_corasick import get_matches as aho_corasick
+from boyer_moore import get_matches as boyer_moore
+from boyer_moore_2 import get_matches as boyer_moore_2
+from compiled import ALGORITHMS, compile
+from find import find_all
+from horspool import get_matches as horspool
+from parallel import parallel_find_all, parallel_find_all_in_file
 from knuth_morris_pratt_modified import get_matches as knuth_morris_pratt_modified
 from knuth_morris_pratt import get_matches as knuth_morris_pratt
+from knuth_morris_pratt import get_stream_matches as knuth_morris_pratt_stream
+from rabin_karp import get_2d_matches, get_set_matches, preprocess
+from rabin_karp import get_matches as rabin_karp
 from shift_or import get_matches as shift_or
+from shift_or import get_hamming_matches, get_levenshtein_matches
+from shift_or import get_stream_matches as shift_or_stream
+from sunday import get_matches as sunday
+from two_way import get_matches as two_way
 from z import get_matches as z
+from z import get_stream_matches as z_stream
 
 ALPHABET_START = 97
 ALPHABET_STOP = 101
@@ -11,7 +30,27 @@ ALPHABET_STOP = 101
 WORD_START = 1
 WORD_STOP = 6
 
-TESTS = [knuth_morris_pratt, knuth_morris_pratt_modified, shift_or, z]
+# Map the test alphabet onto bytes above 127
+HIGH_BYTES = bytes.maketrans(bytes(range(ALPHABET_START, ALPHABET_STOP)), bytes(range(252, 256)))
+
+# Map the test alphabet onto code points outside ASCII
+UNICODE = str.maketrans("abcd", "é中😀\u0100")
+
+TESTS = [
+    boyer_moore,
+    boyer_moore_2,
+    find_all,
+    horspool,
+    knuth_morris_pratt,
+    knuth_morris_pratt_modified,
+    rabin_karp,
+    shift_or,
+    sunday,
+    two_way,
+    z,
+]
+
+STREAM_TESTS = [knuth_morris_pratt_stream, shift_or_stream, z_stream]
 
 
 def get_matches(pattern, text):
@@ -25,6 +64,47 @@ def get_matches(pattern, text):
     return matches
 
 
+def get_hamming_distance(s, t):
+    return sum(x != y for x, y in zip(s, t))
+
+
+def get_hamming_brute_force(pattern, text, k):
+    m = len(pattern)
+    n = len(text)
+
+    return [j for j in range(n - m + 1) if get_hamming_distance(pattern, text[j : j + m]) <= k]
+
+
+# Sellers' algorithm, the edit distance of the pattern to the best substring ending at each stop
+def get_levenshtein_brute_force(pattern, text, k):
+    m = len(pattern)
+
+    column = list(range(m + 1))
+
+    matches = []
+    for j, y in enumerate(text):
+        previous = column
+        column = [0]
+        for i, x in enumerate(pattern):
+            column.append(min(previous[i] + (x != y), previous[i + 1] + 1, column[i] + 1))
+
+        if column[m] <= k:
+            matches.append(j + 1)
+
+    return matches
+
+
+def get_chunks(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def get_words(start=WORD_START, stop=WORD_STOP):
+    letters = list(map(chr, range(ALPHABET_START, ALPHABET_STOP)))
+    products = (product(letters, repeat=i) for i in range(start, stop))
+    tuples = chain.from_iterable(products)
+    return map("".join, tuples)
+
+
 def test_by_example():
     for test in TESTS:
         assert test("aba", "bbabaxababay") == [2, 6, 8]
@@ -32,15 +112,300 @@ def test_by_example():
         assert test("abxabxxx", "abxababxabxxx") == [5]
         assert test("ababcabab", "ababdabacdababcabab") == [10]
 
+    # The empty pattern matches at every offset like str.find, whatever the algorithm
+    assert find_all("", "aba") == [0, 1, 2, 3]
+    assert find_all(b"", b"") == [0]
+    for algorithm in ALGORITHMS:
+        pattern = compile("", algorithm)
+        assert pattern.get_matches("aba") == [0, 1, 2, 3]
+        assert list(pattern.iter_matches("aba")) == [0, 1, 2, 3]
+        assert pattern.find_first("aba") == 0
+        assert pattern.count("aba") == 4
+
+
+def test_boyer_moore_by_example():
+    for test in [boyer_moore, boyer_moore_2]:
+        assert test("aaa", "aaaaa") == [0, 1, 2]
+        assert test("ab", "xxab") == [2]
+        assert test("abaabaab", "abaabaabaabaab") == [0, 3, 6]
+        assert test("acababacaba", "acxcbbacabacabaa") == []
+
+
+def test_by_random():
+    random = Random(0)
+
+    for _ in range(200):
+        text = "".join(random.choice("ab") for _ in range(300))
+        i = random.randrange(250)
+        pattern = text[i : i + random.randrange(1, 40)]
+
+        matches = get_matches(pattern, text)
+        for test in TESTS:
+            assert matches == test(pattern, text)
+
 
 def test_by_brute_force():
-    letters = list(map(chr, range(ALPHABET_START, ALPHABET_STOP)))
-    products = (product(letters, repeat=i) for i in range(WORD_START, WORD_STOP))
-    tuples = chain.from_iterable(products)
-    words = map("".join, tuples)
-    pairs = product(words, repeat=2)
+    pairs = product(get_words(), repeat=2)
+
+    for pattern, text in pairs:
+        matches = get_matches(pattern, text)
+        for test in TESTS:
+            assert matches == test(pattern, text)
+
+
+def test_compiled_by_brute_force():
+    words = get_words(WORD_START, WORD_STOP - 2)
+    patterns = {pattern: [compile(pattern, algorithm) for algorithm in ALGORITHMS] for pattern in words}
+
+    for text in get_words():
+        for pattern, compiled_patterns in patterns.items():
+            matches = get_matches(pattern, text)
+            for compiled_pattern in compiled_patterns:
+                assert matches == compiled_pattern.get_matches(text)
+
+
+def test_variants_by_example():
+    for module in ALGORITHMS.values():
+        assert list(module.iter_matches("aba", "bbabaxababay")) == [2, 6, 8]
+        assert module.find_first("aba", "bbabaxababay") == 2
+        assert module.find_first("abc", "bbabaxababay") == -1
+        assert module.count("a", "a" * 1000) == 1000
+
+    assert compile("aba").find_first("bbabaxababay") == 2
+    assert compile("aba").count("bbabaxababay") == 3
+
+
+def test_variants_by_brute_force():
+    pairs = product(get_words(WORD_START, WORD_STOP - 2), get_words(WORD_START, WORD_STOP - 1))
+
+    for pattern, text in pairs:
+        matches = get_matches(pattern, text)
+        for module in ALGORITHMS.values():
+            assert matches == list(module.iter_matches(pattern, text))
+            assert (matches[0] if matches else -1) == module.find_first(pattern, text)
+            assert len(matches) == module.count(pattern, text)
+
+
+def test_bytes_by_example():
+    for test in TESTS:
+        assert test(b"aba", b"bbabaxababay") == [2, 6, 8]
+        assert test(b"geek", bytearray(b"geeks for geeks")) == [0, 10]
+        assert test(bytearray(b"\xff\x00"), memoryview(b"\x00\xff\x00\xff\xff\x00")) == [1, 4]
+        assert test(memoryview(b"\x80\x81"), b"\x80\x80\x81\x81\x80\x81") == [1, 4]
+
+    assert aho_corasick([b"\xff", b"\xff\x00"], b"\x00\xff\x00") == [(0, 1), (1, 1)]
+
+
+def test_bytes_by_brute_force():
+    pairs = product(get_words(WORD_START, WORD_STOP - 1), repeat=2)
 
     for pattern, text in pairs:
         matches = get_matches(pattern, text)
+        pattern = pattern.encode().translate(HIGH_BYTES)
+        text = memoryview(text.encode().translate(HIGH_BYTES))
         for test in TESTS:
             assert matches == test(pattern, text)
+
+
+def test_unicode_by_example():
+    for test in TESTS:
+        assert test("αβα", "ββαβαξαβαβαψ") == [2, 6, 8]
+        assert test("日本", "日本語の日本") == [0, 4]
+        assert test("😀a", "a😀a😀😀a") == [1, 4]
+
+
+def test_unicode_by_brute_force():
+    pairs = product(get_words(WORD_START, WORD_STOP - 1), repeat=2)
+
+    for pattern, text in pairs:
+        matches = get_matches(pattern, text)
+        pattern = pattern.translate(UNICODE)
+        text = text.translate(UNICODE)
+        for test in TESTS:
+            assert matches == test(pattern, text)
+
+
+def test_mmap():
+    with TemporaryFile() as file:
+        file.write(b"geeks for geeks" * 1000)
+        file.flush()
+
+        with mmap(file.fileno(), 0) as text:
+            matches = list(range(0, 15000, 15)) + list(range(10, 15000, 15))
+            for test in TESTS:
+                assert sorted(test(b"geek", text)) == sorted(matches)
+
+
+def test_mixed_types():
+    for test in TESTS:
+        try:
+            test("aba", b"bbabaxababay")
+            assert False
+        except TypeError:
+            pass
+
+
+def test_aho_corasick_by_example():
+    patterns = ["he", "she", "his", "hers"]
+    assert sorted(aho_corasick(patterns, "ushers")) == [(0, 2), (1, 1), (3, 2)]
+    assert sorted(aho_corasick(patterns, "ahishers")) == [(0, 4), (1, 3), (2, 1), (3, 4)]
+    assert aho_corasick(["a", "a"], "aa") == [(0, 0), (1, 0), (0, 1), (1, 1)]
+    assert sorted(aho_corasick(["", "a"], "aa")) == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1)]
+    assert aho_corasick([""], "") == [(0, 0)]
+
+
+def test_aho_corasick_by_brute_force():
+    patterns = list(get_words(WORD_START, WORD_STOP - 2))
+
+    for text in get_words():
+        matches = [(k, i) for k, pattern in enumerate(patterns) for i in get_matches(pattern, text)]
+        assert sorted(matches) == sorted(aho_corasick(patterns, text))
+
+
+def test_stream_by_example():
+    for test in STREAM_TESTS:
+        assert list(test("aba", ["bba", "", "bax", "a", "babay"])) == [2, 6, 8]
+        assert list(test(b"geek", [b"geeks fo", b"r geeks"])) == [0, 10]
+        assert list(test("ababcabab", iter(["ababdabacdab", "abcabab"]))) == [10]
+
+
+def test_stream_by_brute_force():
+    pairs = product(get_words(WORD_START, WORD_STOP - 1), repeat=2)
+
+    for pattern, text in pairs:
+        matches = get_matches(pattern, text)
+        for size in [1, 2, 3]:
+            chunks = get_chunks(text, size)
+            for test in STREAM_TESTS:
+                assert matches == list(test(pattern, chunks))
+
+
+def test_approximate_by_example():
+    assert get_hamming_matches("abc", "xbcaxcabx", 1) == [0, 3, 6]
+    assert get_hamming_matches("abc", "xbcaxcabx", 0) == []
+    assert get_levenshtein_matches("abc", "xxacxx", 1) == [4]
+    assert get_levenshtein_matches("abc", "xxabxcxx", 1) == [4, 5, 6]
+    assert get_levenshtein_matches(b"survey", b"a surgery", 2) == [7, 8, 9]
+
+
+def test_approximate_long_pattern():
+    pattern = "".join(chr(97 + i % 7) for i in range(150))
+    text = "x" * 100 + pattern[:70] + "yz" + pattern[72:] + "x" * 100
+
+    assert get_hamming_matches(pattern, text, 1) == []
+    assert get_hamming_matches(pattern, text, 2) == [100]
+    assert get_levenshtein_matches(pattern, text, 2) == [250]
+
+
+def test_approximate_by_brute_force():
+    pairs = product(get_words(WORD_START, WORD_STOP - 2), get_words(WORD_START, WORD_STOP - 1))
+
+    for pattern, text in pairs:
+        for k in [0, 1, 2]:
+            assert get_hamming_brute_force(pattern, text, k) == get_hamming_matches(pattern, text, k)
+            assert get_levenshtein_brute_force(pattern, text, k) == get_levenshtein_matches(pattern, text, k)
+
+
+def test_parallel_by_example():
+    text = "geeks for geeks" * 100
+    matches = sorted(list(range(0, 1500, 15)) + list(range(10, 1500, 15)))
+
+    assert parallel_find_all("geek", text, workers=2, chunk_size=7) == matches
+    assert parallel_find_all(b"geek", text.encode(), workers=2, chunk_size=100, algorithm="z") == matches
+
+    with NamedTemporaryFile() as file:
+        file.write(text.encode())
+        file.flush()
+
+        assert parallel_find_all_in_file(b"geek", file.name, workers=2, chunk_size=7) == matches
+
+
+def test_parallel_by_brute_force():
+    pairs = product(get_words(WORD_START, WORD_STOP - 2), get_words(WORD_START, WORD_STOP - 1))
+
+    for pattern, text in pairs:
+        matches = get_matches(pattern, text)
+        for chunk_size in [1, 2, 3]:
+            assert matches == parallel_find_all(pattern, text, workers=1, chunk_size=chunk_size)
+
+
+def test_batch_by_brute_force():
+    importorskip("numpy")
+    from batch import get_batch_matches, pack
+
+    patterns = list(get_words(WORD_START, WORD_STOP - 2))
+    texts = list(get_words())
+    buffer, offsets = pack([text.encode() for text in texts])
+
+    for pattern in patterns:
+        matches = [(k, i) for k, text in enumerate(texts) for i in get_matches(pattern, text)]
+
+        records, starts = get_batch_matches(pattern.encode(), buffer, offsets)
+        assert matches == list(zip(records.tolist(), starts.tolist()))
+
+
+def test_batch_by_example():
+    importorskip("numpy")
+    from batch import get_batch_matches, pack
+
+    buffer, offsets = pack([b"bbabaxababay", b"", b"aba", b"\xffaba\xff"])
+    records, matches = get_batch_matches(bytearray(b"aba"), buffer.tobytes(), offsets.tolist())
+    assert records.tolist() == [0, 0, 0, 2, 3]
+    assert matches.tolist() == [2, 6, 8, 0, 1]
+
+    records, matches = get_batch_matches(b"a" * 64, *pack([b"a" * 65, b"a" * 63]))
+    assert records.tolist() == [0, 0]
+    assert matches.tolist() == [0, 1]
+
+    try:
+        get_batch_matches(b"a" * 65, buffer, offsets)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_rabin_karp_collisions():
+    tables = preprocess("aba", 2, 3)
+    assert rabin_karp("aba", "bbabaxababay", tables) == [2, 6, 8]
+    assert get_set_matches(["ab", "ba"], "abab", 2, 3) == [(0, 0), (1, 1), (0, 2)]
+
+
+def test_rabin_karp_set_by_brute_force():
+    for length in range(WORD_START, WORD_STOP - 2):
+        patterns = list(get_words(length, length + 1))[::3]
+
+        for text in get_words():
+            matches = [(k, i) for k, pattern in enumerate(patterns) for i in get_matches(pattern, text)]
+            assert sorted(matches) == sorted(get_set_matches(patterns, text))
+
+    try:
+        get_set_matches(["a", "ab"], "ab")
+        assert False
+    except ValueError:
+        pass
+
+
+def get_2d_brute_force(pattern, text):
+    height = len(pattern)
+    width = len(pattern[0])
+
+    matches = []
+    for i in range(len(text) - height + 1):
+        for j in range(len(text[0]) - width + 1):
+            if all(text[i + k][j : j + width] == pattern[k] for k in range(height)):
+                matches.append((i, j))
+
+    return matches
+
+
+def test_rabin_karp_2d_by_random():
+    random = Random(0)
+
+    for _ in range(300):
+        text = ["".join(random.choice("ab") for _ in range(7)) for _ in range(6)]
+        i = random.randrange(5)
+        j = random.randrange(6)
+        pattern = [row[j : j + random.randrange(1, 4)] for row in text[i : i + random.randrange(1, 3)]]
+
+        assert get_2d_brute_force(pattern, text) == get_2d_matches(pattern, text)
+        assert get_2d_brute_force(pattern, text) == get_2d_matches(pattern, text, 2, 5)
@@ -0,0 +1,111 @@
+# https://www-igm.univ-mlv.fr/~lecroq/string/node26.html
+# http://monge.univ-mlv.fr/~mac/Articles-PDF/CP-1991-jacm.pdf
+
+from alphabet import get_sequence, get_sequences
+from matches import get_match_functions
+
+
+# Get the start of the maximal suffix of the pattern and its period, for the
+# ordering of the symbols or its reverse
+# Time: O(m), Space: O(1)
+def get_maximal_suffix(pattern, reverse):
+    m = len(pattern)
+
+    i = -1
+    j = 0
+    k = 1
+    p = 1
+    while j + k < m:
+        a = pattern[j + k]
+        b = pattern[i + k]
+
+        if a == b:
+            if k != p:
+                k += 1
+            else:
+                j += p
+                k = 1
+
+        elif (a < b) != reverse:
+            j += k
+            k = 1
+            p = j - i
+
+        else:
+            i = j
+            j = i + 1
+            k = 1
+            p = 1
+
+    return i, p
+
+
+def test_get_maximal_suffix():
+    assert get_maximal_suffix("abcabc", False) == (1, 3)
+    assert get_maximal_suffix("abcabc", True) == (-1, 3)
+    assert get_maximal_suffix("aaa", False) == (-1, 1)
+
+
+# Get the critical factorization pattern[:l + 1], pattern[l + 1:], the period
+# and whether the period of the pattern is the period of its maximal suffix
+# Time: O(m), Space: O(1)
+def preprocess(pattern):
+    pattern = get_sequence(pattern)
+
+    m = len(pattern)
+
+    i, p = get_maximal_suffix(pattern, False)
+    j, q = get_maximal_suffix(pattern, True)
+
+    if i > j:
+        l = i
+        period = p
+    else:
+        l = j
+        period = q
+
+    periodic = period + l + 1 <= m and pattern[: l + 1] == pattern[period : period + l + 1]
+    if not periodic:
+        period = max(l + 1, m - l - 1) + 1
+
+    return l, period, periodic
+
+
+# Find occurrences of the pattern by matching the right of the critical
+# factorization left to right, then its left right to left
+# Time: O(m + n), Space: O(1)
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
+    l, period, periodic = preprocess(pattern) if tables is None else tables
+
+    m = len(pattern)
+    n = len(text)
+
+    # pattern[:memory + 1] is known to match, only if the pattern is periodic
+    memory = -1
+
+    j = 0
+    while j <= n - m:
+        i = max(l, memory) + 1
+        while i < m and pattern[i] == text[i + j]:
+            i += 1
+
+        if i < m:
+            j += i - l
+            memory = -1
+
+        else:
+            i = l
+            while i > memory and pattern[i] == text[i + j]:
+                i -= 1
+
+            if i <= memory:
+                yield j
+
+            j += period
+            if periodic:
+                memory = m - period - 1
+
+
+get_matches, find_first, count = get_match_functions(iter_matches)
@@ -1,3 +1,7 @@
+from alphabet import get_sequence, get_sequences
+from matches import get_match_functions
+
+
 def get_z_values(s):
     n = len(s)
 
@@ -48,24 +52,88 @@ def test_get_z_values():
     assert get_z_values("abacababa ") == [0, 0, 1, 0, 3, 0, 3, 0, 1, 0]
 
 
-DELIMITER = "\x00"
-
-
-def get_matches(pattern, text):
+# Find occurrences of the pattern in the text with the Z values of the pattern,
+# without building the pattern + delimiter + text string.
+def iter_z_matches(pattern, z, text):
     m = len(pattern)
     n = len(text)
 
-    s = pattern + DELIMITER + text
+    l = 0
+    r = 0
 
-    z = get_z_values(s)
+    i = 0
+    while i + m <= n:
+        if i < r and z[i - l] < r - i:
+            j = z[i - l]
 
-    matches = []
+        else:
+            j = max(r - i, 0)
+            while j < m and pattern[j] == text[i + j]:
+                j += 1
 
-    i = m + 1
-    while i < m + n + 1:
-        if z[i] == m:
-            matches.append(i - m - 1)
+            l = i
+            r = i + j
+
+        if j == m:
+            yield i
 
         i += 1
 
-    return matches
+
+def preprocess(pattern):
+    return get_z_values(get_sequence(pattern))
+
+
+def iter_matches(pattern, text, tables=None):
+    pattern, text = get_sequences(pattern, text)
+
+    z = preprocess(pattern) if tables is None else tables
+
+    return iter_z_matches(pattern, z, text)
+
+
+get_matches, find_first, count = get_match_functions(iter_matches)
+
+
+class StreamMatcher:
+    def __init__(self, pattern):
+        self.pattern = get_sequence(pattern)
+        self.z = get_z_values(self.pattern)
+
+        # The last m - 1 symbols, which may start a match that ends in a later chunk
+        self.window = "" if isinstance(self.pattern, str) else b""
+        self.offset = 0
+
+    def feed(self, chunk):
+        pattern, chunk = get_sequences(self.pattern, chunk)
+        z = self.z
+        window = self.window
+
+        m = len(pattern)
+        k = len(window)
+
+        matches = []
+
+        s = window + chunk[: m - 1]
+        for i in iter_z_matches(pattern, z, s):
+            if i < k:
+                matches.append(self.offset + i)
+
+        for i in iter_z_matches(pattern, z, chunk):
+            matches.append(self.offset + k + i)
+
+        if len(chunk) >= m - 1:
+            window = chunk[len(chunk) - m + 1 :]
+        else:
+            window = s[max(len(s) - m + 1, 0) :]
+
+        self.window = window if isinstance(window, str) else bytes(window)
+        self.offset += k + len(chunk) - len(self.window)
+
+        return matches
+
+
+def get_stream_matches(pattern, chunks):
+    matcher = StreamMatcher(pattern)
+    for chunk in chunks:
+        yield from matcher.feed(chunk)
@@ -0,0 +1,131 @@
+from array import array
+
+from disjoint_set import DisjointSet, iter_elements
+
+
+# Path halving and union by size over a flat array of machine integers, a root
+# holds the negative size of its set. Every find points each node on the path
+# to its grandparent iteratively, so long chains never recurse.
+# Time: O(α(n)) amortized per operation, Space: 4 or 8 bytes per element
+class ArrayDisjointSet(DisjointSet):
+    def __init__(self, n):
+        self.n = n
+        self.parent = array("i" if n < 2**31 else "q", [-1]) * n
+
+    def find(self, x):
+        parent = self.parent
+
+        while True:
+            p = parent[x]
+            if p < 0:
+                return x
+
+            g = parent[p]
+            if g < 0:
+                return p
+
+            parent[x] = g
+            x = g
+
+    def union(self, x, y):
+        x_root = self.find(x)
+        y_root = self.find(y)
+
+        if x_root == y_root:
+            return
+
+        x_size = -self.parent[x_root]
+        y_size = -self.parent[y_root]
+
+        if x_size > y_size:
+            self.parent[y_root] = x_root
+            self.parent[x_root] = -(x_size + y_size)
+        else:
+            self.parent[x_root] = y_root
+            self.parent[y_root] = -(x_size + y_size)
+
+    def size(self, x):
+        return -self.parent[self.find(x)]
+
+    # The batched operations inline find and union in one loop to avoid a call per element
+
+    def union_many(self, xs, ys):
+        parent = self.parent
+
+        for x, y in zip(iter_elements(xs), iter_elements(ys)):
+            while parent[x] >= 0:
+                p = parent[x]
+                if parent[p] < 0:
+                    x = p
+                    break
+                parent[x] = parent[p]
+                x = parent[p]
+
+            while parent[y] >= 0:
+                p = parent[y]
+                if parent[p] < 0:
+                    y = p
+                    break
+                parent[y] = parent[p]
+                y = parent[p]
+
+            if x == y:
+                continue
+
+            if parent[x] < parent[y]:
+                parent[x] += parent[y]
+                parent[y] = x
+            else:
+                parent[y] += parent[x]
+                parent[x] = y
+
+    def find_many(self, xs):
+        parent = self.parent
+
+        roots = array(parent.typecode)
+        for x in iter_elements(xs):
+            while parent[x] >= 0:
+                p = parent[x]
+                if parent[p] < 0:
+                    x = p
+                    break
+                parent[x] = parent[p]
+                x = parent[p]
+
+            roots.append(x)
+
+        return roots
+
+    # The label of a root is set by the first, and so smallest, element of its set
+    def labels(self):
+        parent = self.parent
+
+        labels = array(parent.typecode, [-1]) * self.n
+        for x in range(self.n):
+            r = x
+            while parent[r] >= 0:
+                p = parent[r]
+                if parent[p] < 0:
+                    r = p
+                    break
+                parent[r] = parent[p]
+                r = parent[p]
+
+            if labels[r] < 0:
+                labels[r] = x
+            labels[x] = labels[r]
+
+        return labels
+
+
+if __name__ == "__main__":
+    disjoint_set = ArrayDisjointSet(10)
+    disjoint_set.union(1, 2)
+    disjoint_set.union(3, 4)
+
+    print(disjoint_set.find(1))
+    print(disjoint_set.find(2))
+    print(disjoint_set.find(3))
+    print(disjoint_set.find(4))
+    print(disjoint_set.find(5))
+    print(disjoint_set.size(4))
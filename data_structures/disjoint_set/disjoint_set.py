@@ -1,4 +1,19 @@
 from abc import ABC, abstractmethod
+from itertools import chain
+
+# The number of elements of a buffer converted at a time
+BATCH_SIZE = 1 << 16
+
+
+# Iterate over the elements of a sequence. A buffer (array, bytes, NumPy array) is
+# converted BATCH_SIZE elements per call, so the whole input is never copied.
+def iter_elements(xs):
+    try:
+        view = memoryview(xs)
+    except TypeError:
+        return iter(xs)
+
+    return chain.from_iterable(view[i : i + BATCH_SIZE].tolist() for i in range(0, len(view), BATCH_SIZE))
 
 
 class DisjointSet(ABC):
@@ -9,3 +24,24 @@ class DisjointSet(ABC):
     @abstractmethod
     def union(self, x, y):
         pass
+
+    # Union every pair (xs[i], ys[i])
+    def union_many(self, xs, ys):
+        for x, y in zip(iter_elements(xs), iter_elements(ys)):
+            self.union(x, y)
+
+    def find_many(self, xs):
+        return [self.find(x) for x in iter_elements(xs)]
+
+    # Get the label of every element, the smallest element of its set
+    def labels(self):
+        first = {}
+        return [first.setdefault(self.find(x), x) for x in range(self.n)]
+
+    # Get the sets, each sorted and ordered by their smallest element
+    def components(self):
+        components = {}
+        for x, label in enumerate(self.labels()):
+            components.setdefault(label, []).append(x)
+
+        return list(components.values())
@@ -1,12 +1,24 @@
-from pytest import fixture
+from array import array
+from random import Random
 
+from pytest import fixture, importorskip
+
+import disjoint_set
+from array_disjoint_set import ArrayDisjointSet
+from disjoint_set import iter_elements
 from naive_disjoint_set import NaiveDisjointSet
 from union_by_height_disjoint_set import UnionByHeightDisjointSet
 from union_by_rank_disjoint_set import UnionByRankDisjointSet
 from union_by_size_disjoint_set import UnionBySizeDisjointSet
 
 
-DisjointSets = [NaiveDisjointSet, UnionByHeightDisjointSet, UnionByRankDisjointSet, UnionBySizeDisjointSet]
+DisjointSets = [
+    NaiveDisjointSet,
+    UnionByHeightDisjointSet,
+    UnionByRankDisjointSet,
+    UnionBySizeDisjointSet,
+    ArrayDisjointSet,
+]
 
 
 @fixture(params=DisjointSets)
@@ -39,3 +51,78 @@ def test_princeton_university(DisjointSet):
 
     for x in range(10):
         assert disjoint_set.find(0) == disjoint_set.find(x)
+
+
+def test_array_long_chain():
+    n = 100_000
+
+    disjoint_set = ArrayDisjointSet(n)
+    for x in range(n - 1):
+        disjoint_set.parent[x] = x + 1
+    disjoint_set.parent[n - 1] = -n
+
+    assert disjoint_set.find(0) == n - 1
+
+    # Path halving has pointed every other node to its grandparent
+    assert disjoint_set.parent[0] == 2
+    assert disjoint_set.size(0) == n
+
+
+def test_array_size():
+    disjoint_set = ArrayDisjointSet(10)
+    disjoint_set.union(0, 1)
+    disjoint_set.union(2, 3)
+    disjoint_set.union(1, 3)
+    disjoint_set.union(0, 3)
+
+    assert disjoint_set.size(2) == 4
+    assert disjoint_set.size(9) == 1
+
+
+def get_labels(n, edges):
+    labels = list(range(n))
+    for x, y in edges:
+        a, b = labels[x], labels[y]
+        labels = [min(a, b) if label in (a, b) else label for label in labels]
+
+    return labels
+
+
+def test_union_many(DisjointSet):
+    random = Random(0)
+    n = 200
+    xs = array("l", (random.randrange(n) for _ in range(150)))
+    ys = array("l", (random.randrange(n) for _ in range(150)))
+
+    disjoint_set = DisjointSet(n)
+    disjoint_set.union_many(xs, ys)
+
+    labels = get_labels(n, zip(xs, ys))
+    assert list(disjoint_set.labels()) == labels
+
+    roots = disjoint_set.find_many(range(n))
+    assert all((roots[x] == roots[y]) == (labels[x] == labels[y]) for x in range(n) for y in range(x))
+
+    components = disjoint_set.components()
+    assert sorted(x for component in components for x in component) == list(range(n))
+    assert all(labels[x] == component[0] for component in components for x in component)
+
+
+def test_iter_elements(monkeypatch):
+    monkeypatch.setattr(disjoint_set, "BATCH_SIZE", 3)
+
+    assert list(iter_elements(array("i", range(10)))) == list(range(10))
+    assert list(iter_elements(array("i"))) == []
+    assert list(iter_elements(range(10))) == list(range(10))
+
+
+def test_union_many_numpy(DisjointSet):
+    numpy = importorskip("numpy")
+
+    disjoint_set = DisjointSet(6)
+    disjoint_set.union_many(numpy.array([0, 2, 4]), numpy.array([1, 3, 5]))
+    disjoint_set.union_many(numpy.array([1], dtype=numpy.int32), numpy.array([5], dtype=numpy.int32))
+
+    assert disjoint_set.components() == [[0, 1, 4, 5], [2, 3]]
+    roots = disjoint_set.find_many(numpy.arange(6))
+    assert roots[0] == roots[5] != roots[2]
@@ -0,0 +1,207 @@
+# https://doi.org/10.1109/SFCS.2000.892127 (Ferragina and Manzini, Opportunistic data structures with applications)
+# https://www.cs.jhu.edu/~langmea/resources/lecture_notes/bwt_and_fm_index.pdf
+# https://doi.org/10.1016/j.is.2014.06.002 (Claude et al., The wavelet matrix)
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+from suffix_array import get_suffix_array
+
+TERMINAL_CHARACTER = "\x00"
+
+# Every CHECKPOINT_RATE bits of a level of the wavelet matrix store the number of ones before them
+CHECKPOINT_RATE = 256
+
+# Every suffix that starts at a multiple of SAMPLE_RATE stores its start
+SAMPLE_RATE = 32
+
+
+# A sequence of codes in [0, σ) stored as ⌈log σ⌉ bit vectors, answering access
+# and rank in O(log σ) in n⌈log σ⌉ bits, whatever the alphabet.
+#
+# levels      = The bits of every level, level l holds bit height - 1 - l of the codes
+#               ordered by the stable partition of the level above
+# checkpoints = The number of ones in bits[:k * checkpoint_rate] of every level for every k
+# zeros       = The number of zeros of every level
+class WaveletMatrix:
+    def __init__(self, codes, sigma, checkpoint_rate=CHECKPOINT_RATE):
+        if checkpoint_rate % 8:
+            raise ValueError("checkpoint rate must be a multiple of 8")
+
+        self.n = len(codes)
+        self.height = max((sigma - 1).bit_length(), 1)
+        self.checkpoint_rate = checkpoint_rate
+
+        block = checkpoint_rate // 8
+
+        self.levels = []
+        self.checkpoints = []
+        self.zeros = []
+
+        for l in range(self.height):
+            shift = self.height - 1 - l
+
+            bits = bytearray((self.n + 7) // 8)
+            zeros = []
+            ones = []
+            for i, c in enumerate(codes):
+                if c >> shift & 1:
+                    bits[i >> 3] |= 1 << (i & 7)
+                    ones.append(c)
+                else:
+                    zeros.append(c)
+
+            bits = bytes(bits)
+
+            checkpoints = array("i", [0])
+            for start in range(0, len(bits), block):
+                checkpoints.append(checkpoints[-1] + int.from_bytes(bits[start : start + block], "little").bit_count())
+
+            self.levels.append(bits)
+            self.checkpoints.append(checkpoints)
+            self.zeros.append(len(zeros))
+
+            codes = zeros + ones
+
+    # Get the number of ones in bits[:i] of the level
+    # Time: O(1)
+    def get_ones(self, l, i):
+        k = i // self.checkpoint_rate
+        start = k * self.checkpoint_rate // 8
+        stop = (i + 7) // 8
+
+        word = int.from_bytes(self.levels[l][start:stop], "little") & ((1 << (i - k * self.checkpoint_rate)) - 1)
+        return self.checkpoints[l][k] + word.bit_count()
+
+    # Time: O(log σ)
+    def access(self, i):
+        c = 0
+        for l in range(self.height):
+            ones = self.get_ones(l, i)
+            if self.levels[l][i >> 3] >> (i & 7) & 1:
+                c = c << 1 | 1
+                i = self.zeros[l] + ones
+            else:
+                c <<= 1
+                i -= ones
+
+        return c
+
+    # Get the number of c in codes[:i]
+    # Time: O(log σ)
+    def rank(self, c, i):
+        start = 0
+        for l in range(self.height):
+            if c >> (self.height - 1 - l) & 1:
+                start = self.zeros[l] + self.get_ones(l, start)
+                i = self.zeros[l] + self.get_ones(l, i)
+            else:
+                start -= self.get_ones(l, start)
+                i -= self.get_ones(l, i)
+
+        return i - start
+
+
+# The Burrows-Wheeler transform (BWT) of the terminated text is kept as a wavelet
+# matrix of the codes of its symbols, so the index takes about
+# n (⌈log σ⌉ (1 + 32 / checkpoint_rate) / 8 + 8 / sample_rate) bytes plus O(σ), for
+# example 0.7n for DNA, 1.0n for English and 2.2n for CJK with the defaults.
+#
+# alphabet = The sorted distinct symbols of the text, the code of a symbol is its index plus one
+# first    = The row of the first suffix that starts with every code
+# bwt      = The wavelet matrix of the codes of the BWT, the code before every sorted suffix
+# rows     = The sorted rows of the sampled suffixes
+# samples  = The start of the suffix of every row in rows
+class FMIndex:
+    def __init__(self, text, checkpoint_rate=CHECKPOINT_RATE, sample_rate=SAMPLE_RATE):
+        if TERMINAL_CHARACTER in text:
+            raise ValueError("text contains the terminal character")
+
+        self.sample_rate = sample_rate
+
+        symbols = sorted(set(text))
+        self.alphabet = "".join(symbols)
+
+        ranks = {x: k + 1 for k, x in enumerate(symbols)}
+        s = [ranks[x] for x in text]
+        s.append(0)
+        sa = get_suffix_array(s, len(symbols))
+
+        counts = Counter(s)
+        self.first = array("i", [0])
+        for c in range(len(symbols) + 1):
+            self.first.append(self.first[-1] + counts[c])
+
+        self.bwt = WaveletMatrix([s[i - 1] if i > 0 else 0 for i in sa], len(symbols) + 1, checkpoint_rate)
+
+        self.rows = array("i")
+        self.samples = array("i")
+        for row, i in enumerate(sa):
+            if i % sample_rate == 0:
+                self.rows.append(row)
+                self.samples.append(i)
+
+    # Get the code of the symbol, or 0 if it is not in the text
+    # Time: O(log σ)
+    def get_code(self, x):
+        k = bisect_left(self.alphabet, x)
+        return k + 1 if k < len(self.alphabet) and self.alphabet[k] == x else 0
+
+    # Get the range [lo, hi) of the rows of the suffixes that start with the pattern
+    # by extending it one symbol at a time to the left (backward search)
+    # Time: O(m log σ)
+    def get_range(self, pattern):
+        # The row of the terminator, the first, is not a suffix of the text
+        if not pattern:
+            return 1, self.bwt.n
+
+        lo = 0
+        hi = self.bwt.n
+
+        for x in reversed(pattern):
+            c = self.get_code(x)
+            if not c:
+                return 0, 0
+
+            lo = self.first[c] + self.bwt.rank(c, lo)
+            hi = self.first[c] + self.bwt.rank(c, hi)
+            if lo >= hi:
+                return 0, 0
+
+        return lo, hi
+
+    def contains(self, pattern):
+        lo, hi = self.get_range(pattern)
+        return lo < hi or not pattern
+
+    def count(self, pattern):
+        lo, hi = self.get_range(pattern)
+        return hi - lo
+
+    # Get the start of the suffix of the row by stepping to the suffix one symbol
+    # to the left (LF-mapping) until it is sampled
+    # Time: O(sample_rate (log σ + log n))
+    def get_start(self, row):
+        steps = 0
+        while True:
+            k = bisect_left(self.rows, row)
+            if k < len(self.rows) and self.rows[k] == row:
+                return self.samples[k] + steps
+
+            c = self.bwt.access(row)
+            row = self.first[c] + self.bwt.rank(c, row)
+            steps += 1
+
+    # Get the sorted starts of the occurrences of the pattern
+    # Time: O(m log σ + occ sample_rate (log σ + log n))
+    def locate(self, pattern):
+        lo, hi = self.get_range(pattern)
+        return sorted(self.get_start(row) for row in range(lo, hi))
+
+
+if __name__ == "__main__":
+    fm_index = FMIndex("abracadabra")
+    print(fm_index.count("abra"))
+    print(fm_index.locate("a"))
+    print(fm_index.contains("cad"))
@@ -0,0 +1,196 @@
+# https://ge-nong.github.io/publication/2009/09/Linear-Suffix-Array-Construction-by-Almost-Pure-Induced-Sorting/
+# https://github.com/atcoder/ac-library/blob/master/atcoder/string.hpp
+
+from array import array
+
+
+# Get the suffix array of s, a sequence of integers in [0, upper], by induced sorting (SA-IS)
+# Time: O(n), Space: O(n)
+def get_suffix_array(s, upper):
+    n = len(s)
+
+    if n == 0:
+        return array("i")
+    if n == 1:
+        return array("i", [0])
+    if n == 2:
+        return array("i", [0, 1] if s[0] < s[1] else [1, 0])
+
+    sa = array("i", [0]) * n
+
+    # ls[i] is whether the suffix at i is smaller than the suffix at i + 1 (S type)
+    ls = [False] * n
+    for i in range(n - 2, -1, -1):
+        ls[i] = ls[i + 1] if s[i] == s[i + 1] else s[i] < s[i + 1]
+
+    # The starts of the buckets of the S type and L type suffixes of every symbol
+    sum_l = [0] * (upper + 1)
+    sum_s = [0] * (upper + 1)
+    for i in range(n):
+        if not ls[i]:
+            sum_s[s[i]] += 1
+        else:
+            sum_l[s[i] + 1] += 1
+
+    for i in range(upper + 1):
+        sum_s[i] += sum_l[i]
+        if i < upper:
+            sum_l[i + 1] += sum_s[i]
+
+    def induce(lms):
+        for i in range(n):
+            sa[i] = -1
+
+        buf = sum_s[:]
+        for d in lms:
+            if d != n:
+                sa[buf[s[d]]] = d
+                buf[s[d]] += 1
+
+        buf = sum_l[:]
+        sa[buf[s[n - 1]]] = n - 1
+        buf[s[n - 1]] += 1
+        for i in range(n):
+            v = sa[i]
+            if v >= 1 and not ls[v - 1]:
+                sa[buf[s[v - 1]]] = v - 1
+                buf[s[v - 1]] += 1
+
+        buf = sum_l[:]
+        for i in range(n - 1, -1, -1):
+            v = sa[i]
+            if v >= 1 and ls[v - 1]:
+                buf[s[v - 1] + 1] -= 1
+                sa[buf[s[v - 1] + 1]] = v - 1
+
+    # The leftmost S type suffixes, and their index among them
+    lms = [i for i in range(1, n) if not ls[i - 1] and ls[i]]
+    lms_map = array("i", [-1]) * (n + 1)
+    for k, i in enumerate(lms):
+        lms_map[i] = k
+
+    m = len(lms)
+
+    induce(lms)
+
+    if m:
+        # Name the LMS substrings in sorted order, then sort the LMS suffixes recursively
+        sorted_lms = [v for v in sa if lms_map[v] != -1]
+
+        rec_s = [0] * m
+        rec_upper = 0
+        for i in range(1, m):
+            l = sorted_lms[i - 1]
+            r = sorted_lms[i]
+
+            end_l = lms[lms_map[l] + 1] if lms_map[l] + 1 < m else n
+            end_r = lms[lms_map[r] + 1] if lms_map[r] + 1 < m else n
+
+            same = True
+            if end_l - l != end_r - r:
+                same = False
+            else:
+                while l < end_l and s[l] == s[r]:
+                    l += 1
+                    r += 1
+                if l == n or s[l] != s[r]:
+                    same = False
+
+            if not same:
+                rec_upper += 1
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper
+
+        rec_sa = get_suffix_array(rec_s, rec_upper)
+        induce([lms[i] for i in rec_sa])
+
+    return sa
+
+
+# Get the longest common prefix of every suffix and the previous suffix in the suffix array (Kasai)
+# Time: O(n), Space: O(n)
+def get_lcp_array(s, sa):
+    n = len(s)
+
+    rank = array("i", [0]) * n
+    for i, k in enumerate(sa):
+        rank[k] = i
+
+    lcp = array("i", [0]) * n
+
+    h = 0
+    for k in range(n):
+        if h > 0:
+            h -= 1
+
+        i = rank[k]
+        if i == 0:
+            h = 0
+            continue
+
+        j = sa[i - 1]
+        while j + h < n and k + h < n and s[j + h] == s[k + h]:
+            h += 1
+
+        lcp[i] = h
+
+    return lcp
+
+
+class SuffixArray:
+    def __init__(self, text):
+        self.text = text
+
+        symbols = sorted(set(text))
+        ranks = {x: k for k, x in enumerate(symbols)}
+        s = [ranks[x] for x in text]
+
+        self.suffix_array = get_suffix_array(s, max(len(symbols) - 1, 0))
+        self.lcp_array = get_lcp_array(s, self.suffix_array)
+
+    # Get the range [lo, hi) of the suffix array of the suffixes that start with the pattern
+    # Time: O(m log n)
+    def get_range(self, pattern):
+        text = self.text
+        sa = self.suffix_array
+
+        m = len(pattern)
+
+        lo = 0
+        hi = len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[sa[mid] : sa[mid] + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        start = lo
+
+        hi = len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[sa[mid] : sa[mid] + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return start, lo
+
+    def contains(self, pattern):
+        lo, hi = self.get_range(pattern)
+        return lo < hi or not pattern
+
+    def count(self, pattern):
+        lo, hi = self.get_range(pattern)
+        return hi - lo
+
+    def find_all(self, pattern):
+        lo, hi = self.get_range(pattern)
+        return sorted(self.suffix_array[lo:hi])
+
+
+if __name__ == "__main__":
+    suffix_array = SuffixArray("abcab")
+    print(list(suffix_array.suffix_array))
+    print(suffix_array.contains("ab"))
+    print(suffix_array.contains("abb"))
@@ -0,0 +1,149 @@
+# Linear time analytics on the suffix array and LCP array
+# https://doi.org/10.1016/S1570-8667(03)00065-0 (Abouelhoda et al., Replacing suffix trees with enhanced suffix arrays)
+
+from collections import deque
+
+from suffix_array import SuffixArray, get_lcp_array, get_suffix_array
+
+# The left symbol of a set of suffixes with different left symbols, or of the suffix of the whole text
+DIVERSE = object()
+
+
+# Time: O(n)
+def get_longest_repeated_substring(text):
+    suffix_array = SuffixArray(text)
+    sa = suffix_array.suffix_array
+    lcp = suffix_array.lcp_array
+
+    if len(lcp) < 2:
+        return text[:0]
+
+    i = max(range(len(lcp)), key=lcp.__getitem__)
+    return text[sa[i] : sa[i] + lcp[i]]
+
+
+# Every substring is a prefix of a suffix, the prefixes shared with the previous suffix are counted there
+# Time: O(n)
+def get_distinct_substring_count(text):
+    n = len(text)
+    return n * (n + 1) // 2 - sum(SuffixArray(text).lcp_array)
+
+
+# Get the longest substring of every string. The strings are concatenated with a
+# unique separator after each, then a window slides over the suffix array while it
+# holds a suffix of every string, the minimum LCP of the window is a common prefix.
+# Time: O(n) for the total length n
+def get_longest_common_substring(strings):
+    k = len(strings)
+
+    if k == 0:
+        return ""
+    if k == 1:
+        return strings[0]
+
+    # The separators are 0, ..., k - 1 and sort before every symbol
+    symbols = sorted(set().union(*strings))
+    ranks = {x: k + r for r, x in enumerate(symbols)}
+
+    s = []
+    starts = []
+    documents = []
+    for d, string in enumerate(strings):
+        starts.append(len(s))
+        s.extend(ranks[x] for x in string)
+        s.append(d)
+        documents.extend([d] * (len(string) + 1))
+
+    sa = get_suffix_array(s, k + len(symbols) - 1)
+    lcp = get_lcp_array(s, sa)
+
+    counts = [0] * k
+    covered = 0
+
+    # The indices j of lcp in the window (l, r], with increasing lcp[j]
+    minimums = deque()
+
+    length = 0
+    start = 0
+
+    l = 0
+    for r in range(len(sa)):
+        d = documents[sa[r]]
+        counts[d] += 1
+        if counts[d] == 1:
+            covered += 1
+
+        if r > l:
+            while minimums and lcp[minimums[-1]] >= lcp[r]:
+                minimums.pop()
+            minimums.append(r)
+
+        while covered == k:
+            if minimums and lcp[minimums[0]] > length:
+                length = lcp[minimums[0]]
+                start = sa[r]
+
+            d = documents[sa[l]]
+            counts[d] -= 1
+            if counts[d] == 0:
+                covered -= 1
+
+            l += 1
+            while minimums and minimums[0] <= l:
+                minimums.popleft()
+
+    d = documents[start]
+    offset = start - starts[d]
+    return strings[d][offset : offset + length]
+
+
+def get_left_symbol(a, b):
+    if a is None:
+        return b
+
+    return a if a == b else DIVERSE
+
+
+# Get the (start, length, count) of every maximal repeat, a repeated substring that
+# cannot be extended to the left or to the right without losing an occurrence. The
+# lcp-intervals are the right maximal repeats, those whose suffixes do not share
+# one left symbol are also left maximal.
+# Time: O(n)
+def get_maximal_repeats(text):
+    suffix_array = SuffixArray(text)
+    sa = suffix_array.suffix_array
+    lcp = suffix_array.lcp_array
+
+    n = len(sa)
+
+    repeats = []
+
+    # The [lcp, left bound, left symbol] of the open lcp-intervals
+    stack = [[0, 0, None]]
+    for i in range(1, n + 1):
+        h = lcp[i] if i < n else 0
+
+        x = text[sa[i - 1] - 1] if sa[i - 1] > 0 else DIVERSE
+        stack[-1][2] = get_left_symbol(stack[-1][2], x)
+
+        lb = i - 1
+        left = x
+        while h < stack[-1][0]:
+            height, lb, left = stack.pop()
+            if left is DIVERSE:
+                repeats.append((sa[lb], height, i - lb))
+
+            if h <= stack[-1][0]:
+                stack[-1][2] = get_left_symbol(stack[-1][2], left)
+
+        if h > stack[-1][0]:
+            stack.append([h, lb, left])
+
+    return repeats
+
+
+if __name__ == "__main__":
+    print(get_longest_repeated_substring("banana"))
+    print(get_distinct_substring_count("banana"))
+    print(get_longest_common_substring(["xabcabz", "abcaby", "zzcabyy"]))
+    print([("banana"[i : i + l], c) for i, l, c in get_maximal_repeats("banana")])
@@ -0,0 +1,172 @@
+from itertools import chain, product
+from random import Random
+
+from pytest import raises
+
+from fm_index import FMIndex, WaveletMatrix
+from suffix_array import SuffixArray, get_lcp_array
+from suffix_array_analytics import (
+    get_distinct_substring_count,
+    get_longest_common_substring,
+    get_longest_repeated_substring,
+    get_maximal_repeats,
+)
+
+ALPHABET = "abc"
+
+WORD_STOP = 7
+
+
+def get_words(stop=WORD_STOP):
+    return ("".join(letters) for letters in chain.from_iterable(product(ALPHABET, repeat=i) for i in range(stop)))
+
+
+def get_matches(pattern, text):
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+
+def test_suffix_array_by_brute_force():
+    for text in get_words():
+        suffix_array = SuffixArray(text)
+        n = len(text)
+
+        assert list(suffix_array.suffix_array) == sorted(range(n), key=lambda i: text[i:])
+
+        lcp_array = [0] * n
+        for i in range(1, n):
+            s = text[suffix_array.suffix_array[i - 1] :]
+            t = text[suffix_array.suffix_array[i] :]
+            while lcp_array[i] < min(len(s), len(t)) and s[lcp_array[i]] == t[lcp_array[i]]:
+                lcp_array[i] += 1
+        assert list(suffix_array.lcp_array) == lcp_array
+
+
+def test_queries_by_brute_force():
+    patterns = list(get_words(4))[1:]
+
+    for text in get_words(6):
+        suffix_array = SuffixArray(text)
+        for pattern in patterns:
+            matches = get_matches(pattern, text)
+            assert suffix_array.find_all(pattern) == matches
+            assert suffix_array.count(pattern) == len(matches)
+            assert suffix_array.contains(pattern) == (pattern in text)
+
+
+def test_random():
+    random = Random(0)
+
+    text = "".join(random.choice("abcd") for _ in range(5000))
+    suffix_array = SuffixArray(text)
+    assert list(suffix_array.suffix_array) == sorted(range(len(text)), key=lambda i: text[i:])
+
+    for _ in range(100):
+        i = random.randrange(len(text))
+        pattern = text[i : i + random.randrange(1, 10)]
+        assert suffix_array.find_all(pattern) == get_matches(pattern, text)
+
+
+def test_unicode_and_bytes():
+    suffix_array = SuffixArray("日本語の日本")
+    assert suffix_array.find_all("日本") == [0, 4]
+    assert not suffix_array.contains("本日")
+
+    suffix_array = SuffixArray(b"\xff\x00\xff\x00")
+    assert suffix_array.find_all(b"\xff\x00") == [0, 2]
+
+
+def test_empty_pattern():
+    assert SuffixArray("").contains("")
+    assert SuffixArray("ab").contains("")
+    assert SuffixArray("ab").count("") == 2
+
+    for text in ["", "ab"]:
+        suffix_array = SuffixArray(text)
+        fm_index = FMIndex(text)
+        assert fm_index.contains("") == suffix_array.contains("")
+        assert fm_index.count("") == suffix_array.count("") == len(text)
+        assert fm_index.locate("") == suffix_array.find_all("") == list(range(len(text)))
+
+
+def test_get_lcp_array():
+    assert list(get_lcp_array("banana", [5, 3, 1, 0, 4, 2])) == [0, 1, 3, 0, 0, 2]
+
+
+def get_substrings(text):
+    return {text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)}
+
+
+def test_analytics_by_brute_force():
+    for text in get_words():
+        substrings = get_substrings(text)
+        repeated = [s for s in substrings if len(get_matches(s, text)) > 1]
+
+        assert get_distinct_substring_count(text) == len(substrings)
+        assert len(get_longest_repeated_substring(text)) == max(map(len, repeated), default=0)
+
+        maximal_repeats = {}
+        for s in repeated:
+            matches = get_matches(s, text)
+            lefts = {text[i - 1] if i > 0 else None for i in matches}
+            rights = {text[i + len(s)] if i + len(s) < len(text) else None for i in matches}
+            if len(lefts) > 1 or None in lefts:
+                if len(rights) > 1 or None in rights:
+                    maximal_repeats[s] = len(matches)
+
+        repeats = {text[i : i + l]: count for i, l, count in get_maximal_repeats(text)}
+        assert repeats == maximal_repeats
+
+
+def test_longest_common_substring():
+    assert get_longest_common_substring([]) == ""
+    assert get_longest_common_substring(["abc"]) == "abc"
+    assert get_longest_common_substring(["abc", "def"]) == ""
+    assert get_longest_common_substring(["xabcabz", "abcaby", "zzcabyy"]) == "cab"
+
+    random = Random(0)
+    for _ in range(200):
+        strings = ["".join(random.choices("ab", k=random.randrange(1, 12))) for _ in range(random.randrange(2, 5))]
+        common = set.intersection(*map(get_substrings, strings))
+
+        result = get_longest_common_substring(strings)
+        assert len(result) == max(map(len, common), default=0)
+        assert all(result in string for string in strings)
+
+
+def test_fm_index_by_brute_force():
+    patterns = list(get_words(4))[1:]
+    for text in get_words():
+        for fm_index in [FMIndex(text), FMIndex(text, checkpoint_rate=8, sample_rate=3)]:
+            for pattern in patterns:
+                matches = get_matches(pattern, text)
+                assert fm_index.contains(pattern) == bool(matches)
+                assert fm_index.count(pattern) == len(matches)
+                assert fm_index.locate(pattern) == matches
+
+
+def test_fm_index_random():
+    random = Random(0)
+    text = "".join(random.choices("αβγδ", k=5000))
+    fm_index = FMIndex(text, checkpoint_rate=16, sample_rate=8)
+
+    for _ in range(100):
+        i = random.randrange(len(text))
+        pattern = text[i : i + random.randrange(1, 10)]
+        assert fm_index.locate(pattern) == get_matches(pattern, text)
+
+    assert fm_index.count("a") == 0
+
+    with raises(ValueError):
+        FMIndex("a\x00b")
+
+
+def test_wavelet_matrix():
+    random = Random(1)
+    for sigma in [1, 2, 3, 5, 64, 3000]:
+        codes = [random.randrange(sigma) for _ in range(random.randrange(1, 300))]
+        wavelet_matrix = WaveletMatrix(codes, sigma, checkpoint_rate=16)
+
+        assert [wavelet_matrix.access(i) for i in range(len(codes))] == codes
+        for c in set(codes[:5]):
+            for i in range(0, len(codes) + 1, 7):
+                assert wavelet_matrix.rank(c, i) == codes[:i].count(c)
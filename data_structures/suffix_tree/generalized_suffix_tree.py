@@ -0,0 +1,223 @@
+# https://en.wikipedia.org/wiki/Generalized_suffix_tree
+# https://doi.org/10.5555/545381.545469 (Muthukrishnan, Efficient algorithms for document retrieval problems)
+
+from array import array
+from collections import Counter
+
+from suffix_tree import NO_NODE
+from ukkonen_suffix_tree import UkkonenSuffixTree
+
+# The code of the terminator ~k of document k when saved, above every code point
+TERMINATOR_CODE = 0x110000
+
+# The listing is rebuilt once the documents added since the last build are 1 / REBUILD_FACTOR of the text
+REBUILD_FACTOR = 4
+
+
+# The documents are concatenated into one list, each followed by the unique terminator ~k
+# of its id k. Documents are added online by extending the Ukkonen suffix tree.
+class GeneralizedSuffixTree(UkkonenSuffixTree):
+    def __init__(self, documents=()):
+        super().__init__([])
+
+        # The start of every document in the text
+        self.starts = []
+
+        # The leaves of the document being added, their edges end at the global end
+        self.open_leaves = []
+
+        # The leaf order of the documents listed at the last build, see build_listing
+        self.ranges = {}
+        self.documents = array("i")
+        self.previous = array("i")
+        self.table = []
+        self.listed = 0
+
+        # The (id, document) of the documents added since the last build
+        self.pending = []
+        self.pending_size = 0
+
+        for document in documents:
+            self.add_document(document)
+
+    # Time: O(|document| σ), the listing is rebuilt by a later find_documents
+    def add_document(self, document):
+        k = len(self.starts)
+        self.starts.append(len(self.text))
+
+        self.text.extend(document)
+        self.text.append(~k)
+
+        for i in range(self.starts[k], len(self.text)):
+            self.extend(i)
+
+        # The terminator is unique, so every suffix of the document is now a leaf
+        for leaf in self.open_leaves:
+            self.stop[leaf] = self.end
+        self.open_leaves = []
+
+        self.pending.append((k, document))
+        self.pending_size += len(document) + 1
+
+        return k
+
+    def get_leaf(self, i):
+        leaf = super().get_leaf(i)
+        self.open_leaves.append(leaf)
+        return leaf
+
+    # A split has the listed leaves of the child it is split from, so the ranges stay
+    # valid for the listed documents as the tree grows
+    def get_split(self, child, length):
+        split = super().get_split(child, length)
+        if child in self.ranges:
+            self.ranges[split] = self.ranges[child]
+        return split
+
+    def get_code(self, x):
+        return ord(x) if isinstance(x, str) else TERMINATOR_CODE + ~x
+
+    def get_label(self, node):
+        return "".join(x if isinstance(x, str) else "$" for x in self.text[self.start[node] : self.get_stop(node)])
+
+    def get_locus(self, pattern):
+        return super().get_locus(list(pattern))
+
+    def get_document(self, leaf):
+        return ~self.text[self.stop[leaf] - 1]
+
+    # Number the leaves depth first, so the leaves below a node are a range. Adding
+    # documents only inserts leaves and splits edges, so the order of the listed
+    # leaves and the range of listed leaves below every node stay the same.
+    #
+    # ranges    = The range of the listed leaves below every node
+    # documents = The document of every leaf
+    # previous  = The last leaf before every leaf with the same document, or -1
+    # table     = A sparse table of the leaf with the minimum previous in every range of length 2^j
+    #
+    # Time: O(n log n)
+    def build_listing(self):
+        ranges = {}
+        documents = array("i")
+
+        stack = [(self.root, False)]
+        while stack:
+            node, closing = stack.pop()
+            if closing:
+                ranges[node] = ranges[node], len(documents)
+            elif not self.is_leaf(node) or node == self.root:
+                ranges[node] = len(documents)
+                stack.append((node, True))
+                stack.extend((child, False) for child in self.get_children(node))
+            else:
+                ranges[node] = len(documents), len(documents) + 1
+                documents.append(self.get_document(node))
+
+        previous = array("i")
+        last = {}
+        for i, k in enumerate(documents):
+            previous.append(last.get(k, -1))
+            last[k] = i
+
+        table = [array("i", range(len(previous)))]
+        j = 1
+        while 2 * j <= len(previous):
+            row = table[-1]
+            table.append(
+                array("i", (row[i] if previous[row[i]] <= previous[row[i + j]] else row[i + j] for i in range(len(row) - j)))
+            )
+            j *= 2
+
+        self.ranges = ranges
+        self.documents = documents
+        self.previous = previous
+        self.table = table
+        self.listed = len(self.text)
+
+        self.pending = []
+        self.pending_size = 0
+
+    # Get the leaf with the minimum previous in [lo, hi)
+    # Time: O(1)
+    def get_minimum(self, lo, hi):
+        previous = self.previous
+        table = self.table
+
+        j = (hi - lo).bit_length() - 1
+        a = table[j][lo]
+        b = table[j][hi - (1 << j)]
+
+        return a if previous[a] <= previous[b] else b
+
+    # Get the (document, offset) of the occurrences in no particular order
+    # Time: O(m σ + occ)
+    def find_all(self, pattern):
+        node = self.get_locus(pattern)
+        if node == NO_NODE:
+            return []
+
+        result = []
+        for leaf in self.get_leaves(node):
+            k = self.get_document(leaf)
+            result.append((k, self.index[leaf] - self.starts[k]))
+
+        return result
+
+    # Get the documents that contain the pattern in no particular order. The first
+    # leaf of a listed document in the range is the one whose previous leaf of the
+    # same document is before the range, found by recursing around range minimums.
+    # The documents added since the last build are searched directly, and the
+    # listing is rebuilt once they are 1 / REBUILD_FACTOR of the text.
+    #
+    # Time: O(m σ + ndoc + p) for the total length p of the documents added since the
+    # last build, p <= n / REBUILD_FACTOR, and O(n log n) when it rebuilds, which is
+    # O(REBUILD_FACTOR log n) amortized per symbol added
+    def find_documents(self, pattern):
+        if self.pending_size * REBUILD_FACTOR > self.listed:
+            self.build_listing()
+
+        documents = self.documents
+        previous = self.previous
+
+        result = []
+
+        node = self.get_locus(pattern)
+        if node in self.ranges:
+            lo, hi = self.ranges[node]
+
+            stack = [(lo, hi)]
+            while stack:
+                i, j = stack.pop()
+                if i >= j:
+                    continue
+
+                p = self.get_minimum(i, j)
+                if previous[p] >= lo:
+                    continue
+
+                result.append(documents[p])
+                stack.append((i, p))
+                stack.append((p + 1, j))
+
+        if node != NO_NODE:
+            result.extend(k for k, document in self.pending if pattern in document)
+
+        return result
+
+    # Get the number of occurrences of the pattern in every document that contains it
+    # Time: O(m σ + occ)
+    def count_documents(self, pattern):
+        node = self.get_locus(pattern)
+        if node == NO_NODE:
+            return {}
+
+        return dict(Counter(map(self.get_document, self.get_leaves(node))))
+
+
+if __name__ == "__main__":
+    suffix_tree = GeneralizedSuffixTree(["banana", "ananas"])
+    suffix_tree.add_document("bandana")
+
+    print(sorted(suffix_tree.find_documents("ana")))
+    print(suffix_tree.count_documents("an"))
+    print(sorted(suffix_tree.find_all("nan")))
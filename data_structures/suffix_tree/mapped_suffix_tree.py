@@ -0,0 +1,131 @@
+from mmap import ACCESS_READ, mmap
+
+from suffix_tree import FILE_HEADER, FILE_MAGIC, FILE_TYPECODE, FILE_VERSION
+
+
+# A suffix tree written by SuffixTree.save, queried directly from the mapped file.
+# Loading only reads the header, the pages are shared between processes that map
+# the same file.
+class MappedSuffixTree:
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        self.buffer = memoryview(self.mmap)
+        self.views = []
+
+        # A file shorter than the header is padded so it fails the checks below
+        header = bytes(self.buffer[: FILE_HEADER.size]).ljust(FILE_HEADER.size, b"\0")
+
+        magic, version, n, node_count, leaf_count = FILE_HEADER.unpack(header)
+        size = FILE_HEADER.size + 4 * (6 * node_count + leaf_count + n)
+        if magic != FILE_MAGIC or version != FILE_VERSION or len(self.buffer) != size:
+            self.close()
+            raise ValueError("not a suffix tree file")
+
+        offset = FILE_HEADER.size
+        for name, length in [
+            ("start", node_count),
+            ("stop", node_count),
+            ("first_child", node_count),
+            ("child_count", node_count),
+            ("leaf_start", node_count),
+            ("leaf_stop", node_count),
+            ("leaves", leaf_count),
+            ("text", n),
+        ]:
+            view = self.buffer[offset : offset + 4 * length].cast(FILE_TYPECODE)
+            self.views.append(view)
+            setattr(self, name, view)
+            offset += 4 * length
+
+    def close(self):
+        for view in self.views:
+            view.release()
+        self.views = []
+
+        self.buffer.release()
+        self.mmap.close()
+
+    # Binary search the children of the node by their first symbol, or -1 if there is no such child
+    # Time: O(log σ)
+    def get_child(self, node, x):
+        start = self.start
+        text = self.text
+
+        lo = self.first_child[node]
+        hi = lo + self.child_count[node]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            y = text[start[mid]]
+            if y < x:
+                lo = mid + 1
+            elif y > x:
+                hi = mid
+            else:
+                return mid
+
+        return -1
+
+    # Time: O(m log σ)
+    def get_locus(self, pattern):
+        text = self.text
+
+        codes = [ord(x) for x in pattern]
+        m = len(codes)
+
+        # The last code is the terminator of the text, the terminators of a generalized
+        # suffix tree are above every code point
+        if text and text[-1] in codes:
+            return -1
+
+        node = 0
+        i = 0
+        while i < m:
+            child = self.get_child(node, codes[i])
+            if child < 0:
+                return -1
+
+            start = self.start[child]
+            k = min(self.stop[child] - start, m - i)
+            if text[start : start + k].tolist() != codes[i : i + k]:
+                return -1
+
+            node = child
+            i += k
+
+        return node
+
+    def contains(self, pattern):
+        return self.get_locus(pattern) >= 0
+
+    # Time: O(m log σ)
+    def count_occurrences(self, pattern):
+        node = self.get_locus(pattern)
+        return self.leaf_stop[node] - self.leaf_start[node] if node >= 0 else 0
+
+    # Get the starts of the occurrences in lexicographic order of their suffixes
+    # Time: O(m log σ + occ)
+    def find_all(self, pattern):
+        node = self.get_locus(pattern)
+        return self.leaves[self.leaf_start[node] : self.leaf_stop[node]].tolist() if node >= 0 else []
+
+
+def load(path):
+    return MappedSuffixTree(path)
+
+
+if __name__ == "__main__":
+    from os import remove
+    from tempfile import mkstemp
+
+    from ukkonen_suffix_tree import UkkonenSuffixTree
+
+    _, path = mkstemp()
+    UkkonenSuffixTree("abcabx").save(path)
+
+    suffix_tree = load(path)
+    print(suffix_tree.find_all("ab"))
+    suffix_tree.close()
+
+    remove(path)
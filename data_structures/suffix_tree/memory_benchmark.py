@@ -0,0 +1,80 @@
+# Compare the memory of the suffix tree node arrays with the 128 symbol list nodes they replaced
+#
+# python memory_benchmark.py
+# python memory_benchmark.py --size 100000
+
+from argparse import ArgumentParser
+from random import Random
+from tracemalloc import get_traced_memory, start, stop
+
+from suffix_tree import NO_NODE
+from ukkonen_suffix_tree import UkkonenSuffixTree
+
+ASCII_SYMBOLS = 128
+
+SEED = 0
+
+TEXT_LENGTH = 10_000
+
+
+# The node before the node arrays, its edge, suffix link and suffix start and a
+# list of children indexed by the code point of their first symbol
+class LegacyNode:
+    def __init__(self, start, stop, index):
+        self.start = start
+        self.stop = stop
+        self.link = None
+        self.index = index
+        self.children = [None for _ in range(ASCII_SYMBOLS)]
+
+
+def get_peak_memory(function):
+    start()
+    try:
+        result = function()
+        _, peak = get_traced_memory()
+    finally:
+        stop()
+
+    return result, peak
+
+
+# Copy the tree into legacy nodes, so both representations hold the same edges and links
+def get_legacy_tree(suffix_tree):
+    nodes = [
+        LegacyNode(suffix_tree.start[node], suffix_tree.get_stop(node), suffix_tree.index[node])
+        for node in range(len(suffix_tree.start))
+    ]
+
+    for node, legacy_node in enumerate(nodes):
+        if suffix_tree.link[node] != NO_NODE:
+            legacy_node.link = nodes[suffix_tree.link[node]]
+
+        child = suffix_tree.first_child[node]
+        while child != NO_NODE:
+            legacy_node.children[ord(suffix_tree.text[suffix_tree.start[child]])] = nodes[child]
+            child = suffix_tree.next_sibling[child]
+
+    return nodes[suffix_tree.root]
+
+
+def main():
+    parser = ArgumentParser(description="Compare the memory of the suffix tree nodes")
+    parser.add_argument("--size", type=int, default=TEXT_LENGTH)
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args()
+
+    random = Random(args.seed)
+    text = "".join(random.choices("acgt", k=args.size))
+
+    suffix_tree, compact = get_peak_memory(lambda: UkkonenSuffixTree(text))
+    _, legacy = get_peak_memory(lambda: get_legacy_tree(suffix_tree))
+    nodes = len(suffix_tree.start)
+
+    print(f"nodes={nodes}")
+    print(f"legacy  {legacy / nodes:8.1f} bytes/node {legacy / 1e6:8.1f} MB")
+    print(f"compact {compact / nodes:8.1f} bytes/node {compact / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
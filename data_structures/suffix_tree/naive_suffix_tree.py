@@ -0,0 +1,47 @@
+from suffix_tree import NO_NODE, SuffixTree
+
+
+class NaiveSuffixTree(SuffixTree):
+    # Insert every suffix from the root, splitting the edge where it leaves the tree
+    # Time: O(n^2)
+    def __init__(self, text):
+        super().__init__(text)
+
+        text = self.text
+        n = len(text)
+        start = self.start
+        stop = self.stop
+
+        for j in range(n):
+            node = self.root
+            i = j
+            while True:
+                child = self.get_child(node, text[i])
+                if child == NO_NODE:
+                    leaf = self.add_node(i, n)
+                    self.index[leaf] = j
+                    self.add_child(node, leaf)
+                    break
+
+                l = 0
+                while start[child] + l < stop[child] and text[start[child] + l] == text[i + l]:
+                    l += 1
+
+                if start[child] + l == stop[child]:
+                    node = child
+                    i += l
+                    continue
+
+                split = self.add_node(start[child], start[child] + l)
+                self.replace_child(node, child, split)
+                start[child] += l
+                self.add_child(split, child)
+
+                leaf = self.add_node(i + l, n)
+                self.index[leaf] = j
+                self.add_child(split, leaf)
+                break
+
+
+if __name__ == "__main__":
+    print(NaiveSuffixTree("abcabx"))
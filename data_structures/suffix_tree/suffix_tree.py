@@ -1,34 +1,240 @@
-# https://stackoverflow.com/questions/9452701/ukkonens-suffix-tree-algorithm-in-plain-english
+from array import array
+from struct import Struct
 
-ASCII_SYMBOLS = 128
+# https://stackoverflow.com/questions/9452701/ukkonens-suffix-tree-algorithm-in-plain-english
 
 TERMINAL_CHARACTER = "\x00"
 
+# The file written by save, in native byte order:
+# - Header: magic, version, text length, node count, leaf count
+# - Node arrays: start, stop, first child, child count, leaf start, leaf stop
+# - Leaf array: the start of the suffix of every leaf, in lexicographic order
+# - Text: the code points of the text, including the terminal character
+# Nodes are numbered breadth first so the children of a node are consecutive and
+# sorted by their first symbol, the leaves below a node are leaves[leaf start:leaf stop].
+FILE_MAGIC = 0x53554658
+FILE_VERSION = 1
+FILE_HEADER = Struct("=5I")
+FILE_TYPECODE = "I"
+
+# The id of the root, and of no node
+ROOT = 0
+NO_NODE = -1
 
-class Node:
-    def __init__(self, start, stop):
-        self.start = start
-        self.stop = stop
-        self.children = [None for _ in range(ASCII_SYMBOLS)]
+# The stop of a leaf whose edge ends at the global end
+OPEN = -1
 
 
+# The queries shared by the constructions:
+# - Naive algorithm, naive_suffix_tree.py
+# - Ukkonen's algorithm, ukkonen_suffix_tree.py
+#
+# The nodes are integer ids into parallel arrays instead of objects. The children
+# of a node are a linked list through first_child and next_sibling, found by the
+# first symbol of their edge, so a node takes 24 bytes whatever its degree.
+#
+# start, stop  = The edge text[start:stop] into every node, stop is OPEN for a leaf
+#                whose edge ends at the global end
+# link         = The node of the path of every internal node without its first symbol
+# index        = The start of the suffix of every leaf, or -1
+# first_child  = The first child of every node, or NO_NODE
+# next_sibling = The next child of the parent of every node, or NO_NODE
 class SuffixTree:
+    # A str is terminated here, a list is indexed as given and must end with a unique terminator
     def __init__(self, text):
-        self.text = text
-        self.children = [None for _ in range(ASCII_SYMBOLS)]
+        if isinstance(text, str) and TERMINAL_CHARACTER in text:
+            raise ValueError("text contains the terminal character")
+
+        self.text = text + TERMINAL_CHARACTER if isinstance(text, str) else text
+        self.end = len(self.text)
+
+        self.start = array("i")
+        self.stop = array("i")
+        self.link = array("i")
+        self.index = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+
+        self.root = self.add_node(0, 0)
+
+    def add_node(self, start, stop):
+        node = len(self.start)
+
+        self.start.append(start)
+        self.stop.append(stop)
+        self.link.append(NO_NODE)
+        self.index.append(-1)
+        self.first_child.append(NO_NODE)
+        self.next_sibling.append(NO_NODE)
+
+        return node
+
+    def add_child(self, node, child):
+        self.next_sibling[child] = self.first_child[node]
+        self.first_child[node] = child
+
+    # Put the new node in the place of the child in the children of the node
+    # Time: O(σ)
+    def replace_child(self, node, child, new):
+        next_sibling = self.next_sibling
+
+        if self.first_child[node] == child:
+            self.first_child[node] = new
+        else:
+            previous = self.first_child[node]
+            while next_sibling[previous] != child:
+                previous = next_sibling[previous]
+            next_sibling[previous] = new
+
+        next_sibling[new] = next_sibling[child]
+        next_sibling[child] = NO_NODE
+
+    # Get the child whose edge starts with x, or NO_NODE
+    # Time: O(σ)
+    def get_child(self, node, x):
+        text = self.text
+        start = self.start
+        next_sibling = self.next_sibling
+
+        child = self.first_child[node]
+        while child != NO_NODE and text[start[child]] != x:
+            child = next_sibling[child]
+
+        return child
+
+    def is_leaf(self, node):
+        return self.first_child[node] == NO_NODE
+
+    def get_stop(self, node):
+        stop = self.stop[node]
+        return self.end if stop == OPEN else stop
+
+    def get_code(self, x):
+        return ord(x)
+
+    def get_children(self, node):
+        children = []
+
+        child = self.first_child[node]
+        while child != NO_NODE:
+            children.append(child)
+            child = self.next_sibling[child]
+
+        return sorted(children, key=lambda child: self.get_code(self.text[self.start[child]]))
 
-        n = len(self.text)
-        for i, x in enumerate(self.text):
-            if self.children[ord(x)]:
-                None
+    def get_label(self, node):
+        label = self.text[self.start[node] : self.get_stop(node)]
+        return label.replace(TERMINAL_CHARACTER, "$")
+
+    # Get the node at or below the end of the path of the pattern, or NO_NODE if there is no such path
+    # Time: O(m σ)
+    def get_locus(self, pattern):
+        # The terminal character ends the text, it is not a symbol of it
+        if isinstance(pattern, str) and TERMINAL_CHARACTER in pattern:
+            return NO_NODE
+
+        text = self.text
+
+        m = len(pattern)
+
+        node = self.root
+        i = 0
+        while i < m:
+            child = self.get_child(node, pattern[i])
+            if child == NO_NODE:
+                return NO_NODE
+
+            start = self.start[child]
+            k = min(self.get_stop(child) - start, m - i)
+            if text[start : start + k] != pattern[i : i + k]:
+                return NO_NODE
+
+            node = child
+            i += k
+
+        return node
+
+    def get_leaves(self, node):
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+
+        leaves = []
+
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            child = first_child[node]
+            if child == NO_NODE:
+                leaves.append(node)
+
+            while child != NO_NODE:
+                stack.append(child)
+                child = next_sibling[child]
+
+        return leaves
+
+    def contains(self, pattern):
+        return self.get_locus(pattern) != NO_NODE
+
+    # Time: O(m σ + occ)
+    def count_occurrences(self, pattern):
+        node = self.get_locus(pattern)
+        return len(self.get_leaves(node)) if node != NO_NODE else 0
+
+    # Get the starts of the occurrences in no particular order
+    # Time: O(m σ + occ)
+    def find_all(self, pattern):
+        node = self.get_locus(pattern)
+        return [self.index[leaf] for leaf in self.get_leaves(node)] if node != NO_NODE else []
+
+    # Time: O(n)
+    def save(self, path):
+        nodes = [self.root]
+        first_child = array(FILE_TYPECODE)
+        child_count = array(FILE_TYPECODE)
+        for node in nodes:
+            children = self.get_children(node)
+            first_child.append(len(nodes))
+            child_count.append(len(children))
+            nodes.extend(children)
+
+        leaf_start = array(FILE_TYPECODE, bytes(4 * len(nodes)))
+        leaf_stop = array(FILE_TYPECODE, bytes(4 * len(nodes)))
+        leaves = array(FILE_TYPECODE)
+
+        # Number the leaves depth first, a negative entry closes the range of a node
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            if i < 0:
+                leaf_stop[~i] = len(leaves)
+                continue
+
+            leaf_start[i] = len(leaves)
+            if child_count[i]:
+                stack.append(~i)
+                stack.extend(reversed(range(first_child[i], first_child[i] + child_count[i])))
             else:
-                self.children[ord(x)] = Node(i, n)
-                print(self.text[i:])
+                leaves.append(self.index[nodes[i]])
+                leaf_stop[i] = len(leaves)
+
+        start = array(FILE_TYPECODE, (self.start[node] for node in nodes))
+        stop = array(FILE_TYPECODE, (self.get_stop(node) for node in nodes))
+        text = array(FILE_TYPECODE, map(self.get_code, self.text))
+
+        with open(path, "wb") as file:
+            file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, len(text), len(nodes), len(leaves)))
+            for values in [start, stop, first_child, child_count, leaf_start, leaf_stop, leaves, text]:
+                values.tofile(file)
 
+    def __str__(self):
+        result = []
 
-# Construction:
-# - Naive algorithm
-# - Ukkonen's algorithm
+        stack = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node != self.root:
+                result.append(depth * "  " + self.get_label(node))
+            stack.extend((child, depth + 1) for child in reversed(self.get_children(node)))
 
-if __name__ == "__main__":
-    suffix_tree = SuffixTree("abcabz")
+        return "\n".join(result)
@@ -0,0 +1,120 @@
+from random import Random
+
+from generalized_suffix_tree import GeneralizedSuffixTree
+from mapped_suffix_tree import load
+
+
+def get_occurrences(pattern, documents):
+    return [
+        (k, j)
+        for k, document in enumerate(documents)
+        for j in range(len(document) - len(pattern) + 1)
+        if document.startswith(pattern, j)
+    ]
+
+
+def check_queries(suffix_tree, documents, patterns):
+    for pattern in patterns:
+        occurrences = get_occurrences(pattern, documents)
+        counts = {}
+        for k, _ in occurrences:
+            counts[k] = counts.get(k, 0) + 1
+
+        assert suffix_tree.contains(pattern) == bool(occurrences)
+        assert suffix_tree.count_occurrences(pattern) == len(occurrences)
+        assert sorted(suffix_tree.find_all(pattern)) == occurrences
+        assert sorted(suffix_tree.find_documents(pattern)) == sorted(counts)
+        assert suffix_tree.count_documents(pattern) == counts
+
+
+def test_banana():
+    suffix_tree = GeneralizedSuffixTree(["banana", "ananas", "bandana"])
+
+    assert sorted(suffix_tree.find_documents("ana")) == [0, 1, 2]
+    assert sorted(suffix_tree.find_documents("nan")) == [0, 1]
+    assert suffix_tree.find_documents("nab") == []
+    assert suffix_tree.count_documents("an") == {0: 2, 1: 2, 2: 2}
+    assert sorted(suffix_tree.find_all("band")) == [(2, 0)]
+
+
+def test_empty():
+    suffix_tree = GeneralizedSuffixTree()
+    assert not suffix_tree.contains("a")
+    assert suffix_tree.find_documents("") == []
+
+    suffix_tree.add_document("")
+    assert suffix_tree.find_documents("") == [0]
+    assert not suffix_tree.contains("a")
+
+
+def test_incremental():
+    random = Random(0)
+
+    suffix_tree = GeneralizedSuffixTree()
+    documents = []
+    for _ in range(30):
+        document = "".join(random.choices("ab", k=random.randrange(12)))
+        assert suffix_tree.add_document(document) == len(documents)
+        documents.append(document)
+
+        patterns = ["", "a", "b", "ab", "ba", "aab", "abab", "bbb"]
+        check_queries(suffix_tree, documents, patterns)
+
+
+def test_random_documents():
+    random = Random(1)
+    for _ in range(10):
+        documents = ["".join(random.choices("acgt", k=random.randrange(100))) for _ in range(random.randrange(1, 20))]
+        suffix_tree = GeneralizedSuffixTree(documents)
+
+        patterns = [document[i : i + k] for document in documents for i in range(0, len(document), 11) for k in [1, 2, 5]]
+        check_queries(suffix_tree, documents, patterns + ["acgtacg", "z"])
+
+
+def test_save_and_load(tmp_path):
+    documents = ["banana", "ananas", "αβγ"]
+    path = tmp_path / "documents.bin"
+    GeneralizedSuffixTree(documents).save(path)
+
+    suffix_tree = load(path)
+    for pattern in ["ana", "nas", "as", "aα", "βγ", "x"]:
+        assert suffix_tree.count_occurrences(pattern) == len(get_occurrences(pattern, documents))
+    suffix_tree.close()
+
+
+def test_matching_statistics():
+    random = Random(3)
+    for _ in range(20):
+        documents = ["".join(random.choices("ab", k=random.randrange(10))) for _ in range(random.randrange(1, 5))]
+        suffix_tree = GeneralizedSuffixTree(documents)
+
+        query = "".join(random.choices("ab", k=20))
+        statistics = []
+        for i in range(len(query)):
+            l = 0
+            while i + l < len(query) and any(query[i : i + l + 1] in document for document in documents):
+                l += 1
+            statistics.append(l)
+
+        assert suffix_tree.get_matching_statistics(query) == statistics
+
+
+def test_listing_rebuilds():
+    random = Random(4)
+    documents = ["".join(random.choices("ab", k=40)) for _ in range(20)]
+    suffix_tree = GeneralizedSuffixTree(documents)
+    suffix_tree.find_documents("ab")
+    listed = suffix_tree.listed
+
+    # A small document is searched directly without rebuilding the listing
+    documents.append("bbabba")
+    suffix_tree.add_document(documents[-1])
+    check_queries(suffix_tree, documents, ["abb", "bbab", "aa", ""])
+    assert suffix_tree.listed == listed
+
+    for _ in range(10):
+        documents.append("".join(random.choices("ab", k=40)))
+        suffix_tree.add_document(documents[-1])
+        check_queries(suffix_tree, documents, ["abb", "bbab", "aa", "babab"])
+
+    assert suffix_tree.listed > listed
@@ -0,0 +1,149 @@
+from itertools import product
+from random import Random
+
+from pytest import fixture, raises
+
+from mapped_suffix_tree import load
+from naive_suffix_tree import NaiveSuffixTree
+from ukkonen_suffix_tree import UkkonenSuffixTree
+
+
+SuffixTrees = [NaiveSuffixTree, UkkonenSuffixTree]
+
+
+@fixture(params=SuffixTrees)
+def SuffixTree(request):
+    return request.param
+
+
+def get_words(alphabet, stop):
+    for n in range(stop):
+        for word in product(alphabet, repeat=n):
+            yield "".join(word)
+
+
+def get_occurrences(pattern, text):
+    return [j for j in range(len(text) - len(pattern) + 1) if text.startswith(pattern, j)]
+
+
+def check_queries(suffix_tree, text, patterns):
+    for pattern in patterns:
+        occurrences = get_occurrences(pattern, text)
+        assert suffix_tree.contains(pattern) == bool(occurrences)
+        assert suffix_tree.count_occurrences(pattern) == len(occurrences)
+        assert sorted(suffix_tree.find_all(pattern)) == occurrences
+
+
+def test_banana(SuffixTree):
+    suffix_tree = SuffixTree("banana")
+
+    assert suffix_tree.contains("nan")
+    assert not suffix_tree.contains("nab")
+    assert suffix_tree.count_occurrences("ana") == 2
+    assert sorted(suffix_tree.find_all("a")) == [1, 3, 5]
+    assert suffix_tree.find_all("bananas") == []
+
+
+def test_small_words(SuffixTree):
+    patterns = list(get_words("abc", 4))
+    for text in get_words("abc", 7):
+        check_queries(SuffixTree(text), text, patterns)
+
+
+def test_random_words(SuffixTree):
+    random = Random(0)
+    for _ in range(20):
+        text = "".join(random.choices("acgt", k=random.randrange(1, 300)))
+        patterns = [text[i : i + k] for i in range(0, len(text), 7) for k in [1, 3, 8]] + ["acgtacgta"]
+        check_queries(SuffixTree(text), text, patterns)
+
+
+def test_same_tree():
+    for text in get_words("ab", 9):
+        assert str(UkkonenSuffixTree(text)) == str(NaiveSuffixTree(text))
+
+
+def test_suffix_links():
+    suffix_tree = UkkonenSuffixTree("abcabxabcd")
+
+    stack = [(suffix_tree.root, "")]
+    while stack:
+        node, path = stack.pop()
+        children = suffix_tree.get_children(node)
+        if children and node != suffix_tree.root:
+            assert suffix_tree.link[node] == suffix_tree.get_locus(path[1:])
+        for child in children:
+            stack.append((child, path + suffix_tree.text[suffix_tree.start[child] : suffix_tree.get_stop(child)]))
+
+
+def test_save_and_load(SuffixTree, tmp_path):
+    random = Random(1)
+    for k, text in enumerate(["", "banana", "αβγαβ€", "".join(random.choices("acgt", k=500))]):
+        path = tmp_path / f"{k}.bin"
+        SuffixTree(text).save(path)
+
+        mapped_suffix_tree = load(path)
+        patterns = list(get_words(set(text) | {"z"}, 3)) + [text[i : i + 9] for i in range(0, len(text), 13)]
+        check_queries(mapped_suffix_tree, text, patterns)
+        mapped_suffix_tree.close()
+
+
+def test_terminal_character(SuffixTree, tmp_path):
+    with raises(ValueError):
+        SuffixTree("a\x00a")
+
+    suffix_tree = SuffixTree("ab")
+    assert not suffix_tree.contains("b\x00")
+    assert suffix_tree.count_occurrences("\x00") == 0
+
+    path = tmp_path / "ab.bin"
+    suffix_tree.save(path)
+
+    mapped_suffix_tree = load(path)
+    assert not mapped_suffix_tree.contains("b\x00")
+    assert mapped_suffix_tree.count_occurrences("\x00") == 0
+    mapped_suffix_tree.close()
+
+
+def test_load_invalid(tmp_path):
+    path = tmp_path / "invalid.bin"
+
+    for data in [b"abc", b"not a suffix tree file"]:
+        path.write_bytes(data)
+        with raises(ValueError):
+            load(path)
+
+    UkkonenSuffixTree("banana").save(path)
+    path.write_bytes(path.read_bytes()[:-4])
+    with raises(ValueError):
+        load(path)
+
+
+def get_matching_statistics(query, text):
+    statistics = []
+    for i in range(len(query)):
+        l = 0
+        while i + l < len(query) and query[i : i + l + 1] in text:
+            l += 1
+        statistics.append(l)
+
+    return statistics
+
+
+def test_matching_statistics():
+    assert UkkonenSuffixTree("banana").get_matching_statistics("ananas") == [5, 4, 3, 2, 1, 0]
+    assert UkkonenSuffixTree("").get_matching_statistics("ab") == [0, 0]
+    assert UkkonenSuffixTree("ab").get_matching_statistics("") == []
+    assert UkkonenSuffixTree("ab").get_matching_statistics("ab\x00") == [2, 1, 0]
+
+    for text in get_words("ab", 7):
+        suffix_tree = UkkonenSuffixTree(text)
+        for query in get_words("abc", 5):
+            assert suffix_tree.get_matching_statistics(query) == get_matching_statistics(query, text)
+
+    random = Random(2)
+    for _ in range(20):
+        text = "".join(random.choices("acgt", k=random.randrange(1000)))
+        query = "".join(random.choices("acgt", k=200)) + text[100:300] + "".join(random.choices("acgt", k=200))
+        suffix_tree = UkkonenSuffixTree(text)
+        assert suffix_tree.get_matching_statistics(query) == get_matching_statistics(query, text)
@@ -0,0 +1,180 @@
+# https://stackoverflow.com/questions/9452701/ukkonens-suffix-tree-algorithm-in-plain-english
+# https://www.cs.helsinki.fi/u/ukkonen/SuffixT1withFigs.pdf
+
+from suffix_tree import NO_NODE, OPEN, SuffixTree
+
+
+class UkkonenSuffixTree(SuffixTree):
+    # Time: O(n σ), a child is found among its siblings
+    def __init__(self, text):
+        super().__init__(text)
+
+        self.link[self.root] = self.root
+
+        # The active point, the end of the longest suffix that is already in the tree
+        self.active_node = self.root
+        self.active_edge = 0
+        self.active_length = 0
+
+        # The number of suffixes still to be inserted
+        self.remaining = 0
+
+        # The global end of every leaf
+        self.end = 0
+
+        for i in range(len(self.text)):
+            self.extend(i)
+
+    # Get a leaf for the longest suffix of text[:i + 1] that is not in the tree
+    def get_leaf(self, i):
+        leaf = self.add_node(i, OPEN)
+        self.index[leaf] = i - self.remaining + 1
+        return leaf
+
+    # Get a node for the first length symbols of the edge into child
+    def get_split(self, child, length):
+        split = self.add_node(self.start[child], self.start[child] + length)
+        self.link[split] = self.root
+        return split
+
+    # Extend the tree of text[:i] with text[i]
+    def extend(self, i):
+        text = self.text
+        start = self.start
+
+        self.end = i + 1
+        self.remaining += 1
+
+        # The last internal node created in this phase, waiting for its suffix link
+        last = NO_NODE
+
+        while self.remaining > 0:
+            if self.active_length == 0:
+                self.active_edge = i
+
+            child = self.get_child(self.active_node, text[self.active_edge])
+
+            if child == NO_NODE:
+                self.add_child(self.active_node, self.get_leaf(i))
+
+                if last != NO_NODE:
+                    self.link[last] = self.active_node
+                    last = NO_NODE
+
+            else:
+                length = self.get_stop(child) - start[child]
+                if self.active_length >= length:
+                    self.active_edge += length
+                    self.active_length -= length
+                    self.active_node = child
+                    continue
+
+                # The suffix is already in the tree, so are the shorter suffixes
+                if text[start[child] + self.active_length] == text[i]:
+                    if last != NO_NODE:
+                        self.link[last] = self.active_node
+
+                    self.active_length += 1
+                    break
+
+                split = self.get_split(child, self.active_length)
+                self.replace_child(self.active_node, child, split)
+
+                self.add_child(split, self.get_leaf(i))
+
+                start[child] += self.active_length
+                self.add_child(split, child)
+
+                if last != NO_NODE:
+                    self.link[last] = split
+                last = split
+
+            self.remaining -= 1
+
+            if self.active_node == self.root and self.active_length > 0:
+                self.active_length -= 1
+                self.active_edge = i - self.remaining + 1
+            else:
+                self.active_node = self.link[self.active_node]
+
+    # Get the matching statistics of the query, the length of the longest prefix of
+    # query[i:] that is a substring of the text for every i. The match is extended
+    # symbol by symbol, then its first symbol is dropped by following the suffix
+    # link of its node and skipping down the edges by their lengths.
+    # Time: O(|query| σ)
+    def get_matching_statistics(self, query):
+        text = self.text
+        start = self.start
+
+        n = len(query)
+
+        statistics = []
+
+        # The match ends k symbols along the edge into child below node, at string depth d
+        node = self.root
+        d = 0
+        child = NO_NODE
+        k = 0
+
+        l = 0
+        for i in range(n):
+            while i + l < n:
+                if child == NO_NODE:
+                    child = self.get_child(node, query[i + l])
+                    if child == NO_NODE:
+                        break
+
+                # The terminal character of a leaf is not part of any match
+                stop = self.get_stop(child)
+                if start[child] + k == stop - self.is_leaf(child):
+                    break
+
+                if text[start[child] + k] != query[i + l]:
+                    break
+
+                k += 1
+                l += 1
+
+                if start[child] + k == stop:
+                    node = child
+                    d += k
+                    child = NO_NODE
+                    k = 0
+
+            statistics.append(l)
+
+            if l == 0:
+                child = NO_NODE
+                k = 0
+                continue
+
+            l -= 1
+
+            if node == self.root:
+                g = l
+            else:
+                node = self.link[node]
+                d -= 1
+                g = l - d
+
+            child = NO_NODE
+            k = 0
+            while g > 0:
+                child = self.get_child(node, query[i + 1 + d])
+                length = self.get_stop(child) - start[child]
+                if length > g:
+                    k = g
+                    break
+
+                node = child
+                d += length
+                g -= length
+                child = NO_NODE
+
+        return statistics
+
+
+if __name__ == "__main__":
+    suffix_tree = UkkonenSuffixTree("abcabx")
+    print(suffix_tree)
+    print(sorted(suffix_tree.find_all("ab")))
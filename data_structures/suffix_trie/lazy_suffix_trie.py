@@ -0,0 +1,119 @@
+# https://doi.org/10.1002/(SICI)1097-024X(199911)29:13<1105::AID-SPE274>3.0.CO;2-7 (Giegerich et al., Efficient implementation of lazy suffix trees)
+
+from bisect import bisect_left
+from itertools import repeat
+from operator import add
+
+
+# A suffix tree built write only, top down (wotd) on demand. A node holds the
+# starts of the suffixes below it until a query first walks through it, then
+# they are partitioned by their next symbol into children, and the edge into
+# every child is the longest common prefix of its suffixes. The root is the only
+# node before the first query.
+class LazySuffixTrie:
+    class Node:
+        __slots__ = ["start", "stop", "depth", "starts", "count", "children"]
+
+        # The edge into the node is string[start:stop], depth is the length of the path to its end
+        def __init__(self, start, stop, depth, starts):
+            self.start = start
+            self.stop = stop
+            self.depth = depth
+            self.starts = starts
+            self.count = len(starts)
+            self.children = None
+
+    def __init__(self, string):
+        self.string = string
+        self.root = self.Node(0, 0, 0, range(len(string)))
+
+    # Get the length of the longest common prefix of string[i + depth:] for every
+    # start i, stopping where the shortest ends so every suffix covers the edge. The
+    # first symbol is shared, the others are compared one position at a time across
+    # the starts until one differs.
+    # Time: O(|starts| · the length)
+    def get_edge_length(self, starts, depth):
+        string = self.string
+
+        # The starts are increasing, so the last is the shortest suffix
+        limit = len(string) - starts[-1] - depth
+
+        length = 1
+        while length < limit:
+            k = depth + length
+            x = string[starts[0] + k]
+            for i in starts:
+                if string[i + k] != x:
+                    return length
+
+            length += 1
+
+        return length
+
+    # Every node is expanded once, and only the nodes that branch are created. A
+    # text like a^n still branches at every depth where a suffix ends, so the first
+    # query of a^m walks m nodes of up to n starts.
+    # Time: O(|node.starts| · the longest edge into a child)
+    def expand(self, node):
+        string = self.string
+        n = len(string)
+        depth = node.depth
+
+        # The starts are increasing, so the suffixes that end at the node are the last
+        starts = node.starts[: bisect_left(node.starts, n - depth)]
+        symbols = list(map(string.__getitem__, map(add, starts, repeat(depth))))
+
+        # Every suffix of a repetitive text may go on with the same symbol, then the
+        # starts are kept as they are instead of partitioned one at a time
+        partition = {}
+        if len(set(symbols)) == 1:
+            partition[symbols[0]] = starts
+        else:
+            for i, x in zip(starts, symbols):
+                partition.setdefault(x, []).append(i)
+
+        node.children = {}
+        for x, starts in partition.items():
+            i = starts[0]
+            length = n - i - depth if len(starts) == 1 else self.get_edge_length(starts, depth)
+            node.children[x] = self.Node(i + depth, i + depth + length, depth + length, starts)
+
+        node.starts = None
+
+    # Get the node at or below the end of the path of the string, or None if it is not a substring
+    def get_node(self, string):
+        m = len(string)
+
+        parent = self.root
+        i = 0
+        while i < m:
+            if parent.children is None:
+                self.expand(parent)
+
+            child = parent.children.get(string[i])
+            if not child:
+                return None
+
+            k = min(child.stop - child.start, m - i)
+            if not self.string.startswith(string[i : i + k], child.start):
+                return None
+
+            parent = child
+            i += k
+
+        return parent
+
+    def contains(self, string):
+        return self.get_node(string) is not None
+
+    # Get the number of suffixes that start with the string
+    def count(self, string):
+        node = self.get_node(string)
+        return node.count if node else 0
+
+
+if __name__ == "__main__":
+    suffix_trie = LazySuffixTrie("abcab")
+    print(suffix_trie.contains("ab"))
+    print(suffix_trie.contains("abb"))
+    print(suffix_trie.count("b"))
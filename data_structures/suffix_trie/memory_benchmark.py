@@ -0,0 +1,68 @@
+# Compare the memory of the suffix trie node arrays with the 128 symbol list nodes they replaced
+#
+# python memory_benchmark.py
+# python memory_benchmark.py --size 2000
+
+from argparse import ArgumentParser
+from random import Random
+from tracemalloc import get_traced_memory, start, stop
+
+from suffix_trie import NO_NODE, SuffixTrie
+
+ASCII_LEN = 128
+
+SEED = 0
+
+TEXT_LENGTH = 500
+
+
+# The node before the node arrays, a list indexed by the code point of the symbol
+class LegacyNode:
+    def __init__(self):
+        self.children = [None for _ in range(ASCII_LEN)]
+
+
+def get_peak_memory(function):
+    start()
+    try:
+        result = function()
+        _, peak = get_traced_memory()
+    finally:
+        stop()
+
+    return result, peak
+
+
+# Copy the trie into legacy nodes, so both representations hold the same edges
+def get_legacy_trie(suffix_trie):
+    nodes = [LegacyNode() for _ in range(len(suffix_trie.first_child))]
+
+    for node, legacy_node in enumerate(nodes):
+        child = suffix_trie.first_child[node]
+        while child != NO_NODE:
+            legacy_node.children[suffix_trie.symbols[child]] = nodes[child]
+            child = suffix_trie.next_sibling[child]
+
+    return nodes[suffix_trie.root]
+
+
+def main():
+    parser = ArgumentParser(description="Compare the memory of the suffix trie nodes")
+    parser.add_argument("--size", type=int, default=TEXT_LENGTH)
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args()
+
+    random = Random(args.seed)
+    text = "".join(random.choices("acgt", k=args.size))
+
+    suffix_trie, compact = get_peak_memory(lambda: SuffixTrie(text))
+    _, legacy = get_peak_memory(lambda: get_legacy_trie(suffix_trie))
+    nodes = len(suffix_trie.first_child)
+
+    print(f"nodes={nodes}")
+    print(f"legacy  {legacy / nodes:8.1f} bytes/node {legacy / 1e6:8.1f} MB")
+    print(f"compact {compact / nodes:8.1f} bytes/node {compact / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
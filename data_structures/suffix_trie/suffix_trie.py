@@ -1,51 +1,185 @@
-TERMINAL = "\x00"
-ASCII_LEN = 128
+from array import array
 
+TERMINAL = "\x00"
 
+# The id of the root, and of no node
+ROOT = 0
+NO_NODE = -1
+
+
+# The nodes are integer ids into parallel arrays instead of objects. The children
+# of a node are a linked list through first_child and next_sibling, so a node
+# takes 12 bytes, or 16 compressed, whatever the number of its children.
+#
+# A compressed suffix trie (Patricia trie) collapses every chain of single child
+# nodes into one edge, so it has O(n) nodes instead of O(n^2).
+#
+# first_child  = The first child of every node, or NO_NODE
+# next_sibling = The next child of the parent of every node, or NO_NODE
+# symbols      = The code point of the symbol of the edge into every node
+# start, stop  = The edge string[start:stop] into every node of a compressed trie
 class SuffixTrie:
-    class Node:
-        def __init__(self):
-            self.children = [None for _ in range(ASCII_LEN)]
+    def __init__(self, string, compressed=False):
+        self.string = string
+        self.compressed = compressed
 
-        def __str__(self, depth=0):
-            result = []
-            indent = depth * "  "
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        if compressed:
+            self.start = array("i")
+            self.stop = array("i")
+        else:
+            self.symbols = array("I")
 
-            for k, child in enumerate(self.children):
-                if child:
-                    x = chr(k)
-                    result.append(indent + x)
-                    result.append(child.__str__(depth=depth + 1))
+        self.root = self.add_node(NO_NODE, 0, 0)
 
-            return "\n".join(result)
+        for i in range(len(string)):
+            if compressed:
+                self.insert_compressed(i)
+            else:
+                self.insert(i)
 
-    def __init__(self, string):
-        self.root = self.Node()
+    # Add a child below the parent, with the edge string[start:stop] if compressed
+    # or else the symbol string[start]
+    def add_node(self, parent, start, stop):
+        node = len(self.first_child)
 
-        for i in range(len(string)):
-            parent = self.root
-            for j in range(i, len(string)):
-                x = string[j]
-                k = ord(x)
+        self.first_child.append(NO_NODE)
+        self.next_sibling.append(NO_NODE)
+        if self.compressed:
+            self.start.append(start)
+            self.stop.append(stop)
+        else:
+            self.symbols.append(ord(self.string[start]) if start < stop else 0)
+
+        if parent != NO_NODE:
+            self.next_sibling[node] = self.first_child[parent]
+            self.first_child[parent] = node
+
+        return node
+
+    def get_symbol(self, node):
+        return self.string[self.start[node]] if self.compressed else chr(self.symbols[node])
+
+    # Time: O(σ)
+    def get_child(self, node, x):
+        child = self.first_child[node]
+        while child != NO_NODE and self.get_symbol(child) != x:
+            child = self.next_sibling[child]
+
+        return child
+
+    def get_children(self, node):
+        children = []
+
+        child = self.first_child[node]
+        while child != NO_NODE:
+            children.append(child)
+            child = self.next_sibling[child]
+
+        return sorted(children, key=self.get_symbol)
+
+    def insert(self, i):
+        string = self.string
+
+        parent = self.root
+        for j in range(i, len(string)):
+            child = self.get_child(parent, string[j])
+            if child == NO_NODE:
+                child = self.add_node(parent, j, j + 1)
 
-                if not parent.children[k]:
-                    parent.children[k] = self.Node()
+            parent = child
 
-                parent = parent.children[k]
+    def insert_compressed(self, i):
+        string = self.string
+        n = len(string)
+        start = self.start
+        stop = self.stop
 
-    def __str__(self, depth=0):
-        return self.root.__str__()
+        parent = self.root
+        j = i
+        while j < n:
+            child = self.get_child(parent, string[j])
+            if child == NO_NODE:
+                self.add_node(parent, j, n)
+                return
+
+            k = start[child]
+            while k < stop[child] and j < n and string[k] == string[j]:
+                k += 1
+                j += 1
+
+            if k == stop[child]:
+                parent = child
+                continue
+
+            # The suffix ends inside the edge
+            if j == n:
+                return
+
+            # The split takes the place of the child, which keeps the rest of the edge
+            split = self.add_node(NO_NODE, start[child], k)
+            if self.first_child[parent] == child:
+                self.first_child[parent] = split
+            else:
+                previous = self.first_child[parent]
+                while self.next_sibling[previous] != child:
+                    previous = self.next_sibling[previous]
+                self.next_sibling[previous] = split
+            self.next_sibling[split] = self.next_sibling[child]
+
+            start[child] = k
+            self.next_sibling[child] = NO_NODE
+            self.first_child[split] = child
+            self.add_node(split, j, n)
+            return
+
+    def get_label(self, node):
+        if self.compressed:
+            return self.string[self.start[node] : self.stop[node]]
+
+        return chr(self.symbols[node])
+
+    def __str__(self, node=ROOT, depth=0):
+        result = []
+        indent = depth * "  "
+
+        for child in self.get_children(node):
+            result.append(indent + self.get_label(child))
+            result.append(self.__str__(child, depth + 1))
+
+        return "\n".join(result)
 
     def contains(self, string):
+        if self.compressed:
+            return self.contains_compressed(string)
+
         parent = self.root
         for i in range(len(string)):
-            x = string[i]
-            k = ord(x)
+            parent = self.get_child(parent, string[i])
+            if parent == NO_NODE:
+                return False
+
+        return True
+
+    # Compare whole edges with the string instead of hopping one node per symbol
+    def contains_compressed(self, string):
+        m = len(string)
 
-            if not parent.children[k]:
+        parent = self.root
+        i = 0
+        while i < m:
+            child = self.get_child(parent, string[i])
+            if child == NO_NODE:
+                return False
+
+            start = self.start[child]
+            k = min(self.stop[child] - start, m - i)
+            if not self.string.startswith(string[i : i + k], start):
                 return False
 
-            parent = parent.children[k]
+            parent = child
+            i += k
 
         return True
 
@@ -55,3 +189,8 @@ if __name__ == "__main__":
     print(suffix_tree)
     print(suffix_tree.contains("ab"))
     print(suffix_tree.contains("abb"))
+
+    suffix_tree = SuffixTrie("abcab", compressed=True)
+    print(suffix_tree)
+    print(suffix_tree.contains("ab"))
+    print(suffix_tree.contains("abb"))
@@ -0,0 +1,95 @@
+from itertools import product
+from random import Random
+
+from lazy_suffix_trie import LazySuffixTrie
+from suffix_trie import SuffixTrie
+
+
+def get_words(alphabet, stop):
+    for n in range(stop):
+        for word in product(alphabet, repeat=n):
+            yield "".join(word)
+
+
+def get_matches(pattern, text):
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+
+def test_contains_by_brute_force():
+    patterns = list(get_words("abc", 5))
+    for text in get_words("abc", 6):
+        suffix_tries = [SuffixTrie(text), SuffixTrie(text, compressed=True), LazySuffixTrie(text)]
+        for pattern in patterns:
+            for suffix_trie in suffix_tries:
+                assert suffix_trie.contains(pattern) == (pattern in text)
+
+
+def get_node_count(suffix_trie):
+    count = 0
+
+    stack = [suffix_trie.root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(suffix_trie.get_children(node))
+
+    return count
+
+
+def test_compressed():
+    random = Random(1)
+    for _ in range(20):
+        text = "".join(random.choices("ab", k=random.randrange(1, 200)))
+        suffix_trie = SuffixTrie(text, compressed=True)
+
+        # A root, at most n leaves and fewer than n branching nodes
+        assert get_node_count(suffix_trie) <= 2 * len(text)
+
+        for _ in range(50):
+            i = random.randrange(len(text))
+            pattern = text[i : i + random.randrange(1, 20)]
+            assert suffix_trie.contains(pattern)
+            assert not suffix_trie.contains(pattern + "c")
+
+
+def test_lazy_count():
+    random = Random(0)
+    text = "".join(random.choices("acgt", k=2000))
+    suffix_trie = LazySuffixTrie(text)
+
+    for _ in range(200):
+        i = random.randrange(len(text))
+        pattern = text[i : i + random.randrange(1, 12)]
+        assert suffix_trie.count(pattern) == len(get_matches(pattern, text))
+
+    assert suffix_trie.count("acgtz") == 0
+    assert suffix_trie.count("") == len(text)
+
+
+def test_lazy_expansion():
+    text = "mississippi" * 100
+    suffix_trie = LazySuffixTrie(text)
+    assert suffix_trie.root.children is None
+
+    assert suffix_trie.contains("ssip")
+
+    # Only the nodes on the path of the pattern are expanded
+    expanded = []
+    stack = [suffix_trie.root]
+    while stack:
+        node = stack.pop()
+        if node.children is not None:
+            expanded.append(node)
+            stack.extend(node.children.values())
+
+    # Every expansion covers a whole edge and drops the starts it partitioned
+    assert len(expanded) <= len("ssip")
+    assert all(node.starts is None for node in expanded)
+    assert suffix_trie.count("ssip") == 100
+
+
+def test_lazy_repetitive():
+    suffix_trie = LazySuffixTrie("ab" * 1000)
+    assert suffix_trie.count("ab" * 100) == 901
+    assert not suffix_trie.contains("ab" * 1000 + "a")
+    assert suffix_trie.count("b" + "ab" * 999) == 1